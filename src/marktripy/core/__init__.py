@@ -3,5 +3,6 @@
 
 from marktripy.core.ast import ASTNode
 from marktripy.core.parser import Parser
+from marktripy.core.walker import ASTWalker
 
-__all__ = ["ASTNode", "Parser"]
+__all__ = ["ASTNode", "ASTWalker", "Parser"]
@@ -3,14 +3,44 @@
 
 from __future__ import annotations
 
+import copy
+import os
+import sys
 from abc import ABC
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Self
 
 from loguru import logger
 
-
-@dataclass
+# Per-node debug logging costs a string format and a loguru dispatch on every
+# node even when the record is discarded, so it is only enabled when the
+# MARKTRIPY_DEBUG environment variable is set at import time.
+_DEBUG = bool(os.environ.get("MARKTRIPY_DEBUG"))
+
+# Node type tags. Interned so that equality checks against them in hot loops
+# short-circuit on identity.
+TYPE_DOCUMENT = sys.intern("document")
+TYPE_HEADING = sys.intern("heading")
+TYPE_PARAGRAPH = sys.intern("paragraph")
+TYPE_TEXT = sys.intern("text")
+TYPE_EMPHASIS = sys.intern("emphasis")
+TYPE_STRONG = sys.intern("strong")
+TYPE_LINK = sys.intern("link")
+TYPE_IMAGE = sys.intern("image")
+TYPE_CODE_BLOCK = sys.intern("code_block")
+TYPE_INLINE_CODE = sys.intern("inline_code")
+TYPE_LIST = sys.intern("list")
+TYPE_LIST_ITEM = sys.intern("list_item")
+TYPE_BLOCKQUOTE = sys.intern("blockquote")
+TYPE_HORIZONTAL_RULE = sys.intern("horizontal_rule")
+TYPE_TABLE = sys.intern("table")
+TYPE_TABLE_ROW = sys.intern("table_row")
+TYPE_TABLE_CELL = sys.intern("table_cell")
+TYPE_STRIKETHROUGH = sys.intern("strikethrough")
+
+
+@dataclass(slots=True)
 class ASTNode(ABC):
     """Base class for all AST nodes.
 
@@ -20,130 +50,244 @@ class ASTNode(ABC):
     Attributes:
         type: The type of node (e.g., 'heading', 'paragraph', 'list')
         children: List of child nodes
-        attrs: Dictionary of attributes (e.g., 'id', 'class')
+        attrs: Dictionary of attributes (e.g., 'id', 'class'), or None until
+            the first attribute is set
         content: Optional text content for leaf nodes
-        meta: Parser-specific metadata (e.g., source position)
+        meta: Parser-specific metadata (e.g., source position), or None when
+            there is none
+
+    Construction does no validation of its own; use ``ASTValidator`` to check
+    hand-built trees (e.g. for nodes with an empty type).
     """
 
     type: str
     children: list[ASTNode] = field(default_factory=list)
-    attrs: dict[str, Any] = field(default_factory=dict)
+    attrs: dict[str, Any] | None = None
     content: str | None = None
-    meta: dict[str, Any] = field(default_factory=dict)
-
-    def __post_init__(self) -> None:
-        """Validate node after initialization."""
-        if not self.type:
-            raise ValueError("Node type cannot be empty")
-        logger.debug(f"Created ASTNode: type={self.type}, children={len(self.children)}")
+    meta: dict[str, Any] | None = None
 
     def add_child(self, child: ASTNode) -> None:
         """Add a child node."""
         self.children.append(child)
-        logger.debug(f"Added child {child.type} to {self.type}")
+        if _DEBUG:
+            logger.debug(f"Added child {child.type} to {self.type}")
+
+    def add_children(self, children: Iterable[ASTNode]) -> None:
+        """Add several child nodes in one list extend."""
+        self.children.extend(children)
+        if _DEBUG:
+            logger.debug(f"Added children to {self.type} ({len(self.children)} total)")
 
     def remove_child(self, child: ASTNode) -> None:
         """Remove a child node."""
         self.children.remove(child)
-        logger.debug(f"Removed child {child.type} from {self.type}")
+        if _DEBUG:
+            logger.debug(f"Removed child {child.type} from {self.type}")
 
     def get_attr(self, name: str, default: Any = None) -> Any:
         """Get an attribute value."""
+        if self.attrs is None:
+            return default
         return self.attrs.get(name, default)
 
     def set_attr(self, name: str, value: Any) -> None:
         """Set an attribute value."""
+        if self.attrs is None:
+            self.attrs = {}
         self.attrs[name] = value
-        logger.debug(f"Set attribute {name}={value} on {self.type}")
+        if _DEBUG:
+            logger.debug(f"Set attribute {name}={value} on {self.type}")
+
+    def iter_walk(self) -> Iterator[ASTNode]:
+        """Iterate over the tree in depth-first order without building a list.
+
+        Children are read after their parent is yielded, so a consumer may
+        replace ``node.children`` and the walk continues into the new list.
+        """
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            # Push children reversed so they are popped in document order
+            stack.extend(reversed(node.children))
 
     def walk(self) -> list[ASTNode]:
         """Walk the tree and return all nodes in depth-first order."""
-        nodes = [self]
-        for child in self.children:
-            nodes.extend(child.walk())
-        return nodes
+        return list(self.iter_walk())
+
+    def flatten(self) -> list[tuple[ASTNode, int]]:
+        """Flatten the tree into a pre-order array for linear traversal.
+
+        Each entry is ``(node, size)``, where ``size`` counts the node and all
+        of its descendants, so ``flat[i + 1 : i + size]`` is the subtree of
+        ``flat[i]`` and ``i + size`` is the index of its next sibling. The
+        array is a snapshot; flatten again after mutating the tree.
+
+        Returns:
+            List of (node, subtree size) pairs in depth-first order
+        """
+        nodes: list[ASTNode] = []
+        sizes: list[int] = []
+        # Ints on the stack mark the end of the subtree started at that index
+        stack: list[ASTNode | int] = [self]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, int):
+                sizes[item] = len(nodes) - item
+                continue
+            stack.append(len(nodes))
+            nodes.append(item)
+            sizes.append(1)
+            stack.extend(reversed(item.children))
+        return list(zip(nodes, sizes, strict=True))
 
     def find_all(self, node_type: str) -> list[ASTNode]:
         """Find all nodes of a specific type in the subtree."""
-        return [node for node in self.walk() if node.type == node_type]
+        node_type = sys.intern(node_type)
+        return [node for node in self.iter_walk() if node.type == node_type]
+
+    def freeze(self) -> None:
+        """Convert every children list in the subtree to a tuple.
+
+        Tuples are smaller than lists and iterate faster, which helps when a
+        finished tree is rendered repeatedly. Renderers and read-only
+        traversals work unchanged, but add_child, remove_child and
+        replace_child fail on a frozen node; assign a new list to
+        ``node.children`` to make it mutable again.
+        """
+        for node in self.iter_walk():
+            node.children = tuple(node.children)  # type: ignore[assignment]
 
     def replace_child(self, old_child: ASTNode, new_child: ASTNode) -> None:
         """Replace a child node with another."""
         try:
             index = self.children.index(old_child)
             self.children[index] = new_child
-            logger.debug(f"Replaced child {old_child.type} with {new_child.type}")
+            if _DEBUG:
+                logger.debug(f"Replaced child {old_child.type} with {new_child.type}")
         except ValueError as e:
             raise ValueError(f"Child {old_child.type} not found in {self.type}") from e
 
-    def clone(self) -> ASTNode:
-        """Create a deep copy of this node and its subtree."""
-        import copy
+    def clone(self) -> Self:
+        """Create a deep copy of this node and its subtree.
 
-        # Create a shallow copy of the node
+        Copies with an explicit stack of (original, copy) pairs, so deeply
+        nested trees cannot hit the recursion limit.
+        """
         cloned = copy.copy(self)
-        # Deep copy the mutable attributes
-        cloned.children = [child.clone() for child in self.children]
-        cloned.attrs = self.attrs.copy()
-        cloned.meta = self.meta.copy()
+        stack: list[tuple[ASTNode, ASTNode]] = [(self, cloned)]
+        while stack:
+            node, node_copy = stack.pop()
+            # Deep copy the mutable attributes
+            if node.attrs is not None:
+                node_copy.attrs = node.attrs.copy()
+            if node.meta is not None:
+                node_copy.meta = node.meta.copy()
+            node_copy.children = [copy.copy(child) for child in node.children]
+            stack.extend(zip(node.children, node_copy.children, strict=True))
         return cloned
 
 
 # Concrete node types
-@dataclass
+#
+# @dataclass(slots=True) rebuilds each class, so the zero-argument super() form
+# would bind to the discarded pre-slots class. Use the two-argument form instead.
+@dataclass(slots=True)
 class Document(ASTNode):
     """Root document node."""
 
     def __init__(self, **kwargs):
-        super().__init__(type="document", **kwargs)
+        super(Document, self).__init__(type=TYPE_DOCUMENT, **kwargs)
 
 
-@dataclass
+@dataclass(slots=True)
 class Heading(ASTNode):
     """Heading node with level."""
 
     level: int = 1
 
     def __init__(self, level: int = 1, **kwargs):
-        super().__init__(type="heading", **kwargs)
+        super(Heading, self).__init__(type=TYPE_HEADING, **kwargs)
         self.level = level
         if not 1 <= level <= 6:
             raise ValueError(f"Heading level must be 1-6, got {level}")
 
 
-@dataclass
+@dataclass(slots=True)
 class Paragraph(ASTNode):
     """Paragraph node."""
 
     def __init__(self, **kwargs):
-        super().__init__(type="paragraph", **kwargs)
+        super(Paragraph, self).__init__(type=TYPE_PARAGRAPH, **kwargs)
 
 
-@dataclass
+@dataclass(slots=True)
 class Text(ASTNode):
     """Text leaf node."""
 
     def __init__(self, content: str, **kwargs):
-        super().__init__(type="text", content=content, **kwargs)
+        super(Text, self).__init__(type=TYPE_TEXT, content=content, **kwargs)
+
 
+# Cache of shared Text leaves handed out by make_text(shared=True)
+_TEXT_INTERN: dict[str, Text] = {}
+_TEXT_INTERN_MAX_LEN = 2
+_TEXT_INTERN_MAX_SIZE = 4096
 
-@dataclass
+
+def make_text(content: str, shared: bool = False) -> Text:
+    """Create a Text node without going through the __init__ chain.
+
+    Equivalent to ``Text(content=content)``, but assigns the slots directly
+    instead of calling Text.__init__ and the generated ASTNode.__init__.
+    Parsers use it for the leaf nodes that dominate most documents.
+
+    With ``shared=True``, nodes for very short content (spaces, line breaks,
+    punctuation) come from a module-level cache, so the same instance can
+    appear many times in one tree and across trees. Only request shared
+    nodes for ASTs that are treated as read-only, e.g. after ``freeze()``.
+
+    Args:
+        content: Text content
+        shared: Return a cached node for content of at most two characters
+
+    Returns:
+        Text node
+    """
+    if shared and len(content) <= _TEXT_INTERN_MAX_LEN:
+        node = _TEXT_INTERN.get(content)
+        if node is None:
+            node = make_text(content)
+            if len(_TEXT_INTERN) < _TEXT_INTERN_MAX_SIZE:
+                _TEXT_INTERN[content] = node
+        return node
+
+    node = object.__new__(Text)
+    node.type = TYPE_TEXT
+    node.children = []
+    node.attrs = None
+    node.content = content
+    node.meta = None
+    return node
+
+
+@dataclass(slots=True)
 class Emphasis(ASTNode):
     """Emphasis (italic) node."""
 
     def __init__(self, **kwargs):
-        super().__init__(type="emphasis", **kwargs)
+        super(Emphasis, self).__init__(type=TYPE_EMPHASIS, **kwargs)
 
 
-@dataclass
+@dataclass(slots=True)
 class Strong(ASTNode):
     """Strong (bold) node."""
 
     def __init__(self, **kwargs):
-        super().__init__(type="strong", **kwargs)
+        super(Strong, self).__init__(type=TYPE_STRONG, **kwargs)
 
 
-@dataclass
+@dataclass(slots=True)
 class Link(ASTNode):
     """Link node with href and title."""
 
@@ -151,7 +295,7 @@ class Link(ASTNode):
     title: str | None = None
 
     def __init__(self, href: str = "", title: str | None = None, **kwargs):
-        super().__init__(type="link", **kwargs)
+        super(Link, self).__init__(type=TYPE_LINK, **kwargs)
         self.href = href
         self.title = title
         self.set_attr("href", href)
@@ -159,7 +303,7 @@ class Link(ASTNode):
             self.set_attr("title", title)
 
 
-@dataclass
+@dataclass(slots=True)
 class Image(ASTNode):
     """Image node with src, alt, and title."""
 
@@ -168,7 +312,7 @@ class Image(ASTNode):
     title: str | None = None
 
     def __init__(self, src: str = "", alt: str = "", title: str | None = None, **kwargs):
-        super().__init__(type="image", **kwargs)
+        super(Image, self).__init__(type=TYPE_IMAGE, **kwargs)
         self.src = src
         self.alt = alt
         self.title = title
@@ -178,28 +322,28 @@ class Image(ASTNode):
             self.set_attr("title", title)
 
 
-@dataclass
+@dataclass(slots=True)
 class CodeBlock(ASTNode):
     """Code block with optional language."""
 
     language: str | None = None
 
     def __init__(self, content: str, language: str | None = None, **kwargs):
-        super().__init__(type="code_block", content=content, **kwargs)
+        super(CodeBlock, self).__init__(type=TYPE_CODE_BLOCK, content=content, **kwargs)
         self.language = language
         if language:
             self.set_attr("language", language)
 
 
-@dataclass
+@dataclass(slots=True)
 class InlineCode(ASTNode):
     """Inline code node."""
 
     def __init__(self, content: str, **kwargs):
-        super().__init__(type="inline_code", content=content, **kwargs)
+        super(InlineCode, self).__init__(type=TYPE_INLINE_CODE, content=content, **kwargs)
 
 
-@dataclass
+@dataclass(slots=True)
 class List(ASTNode):
     """List node (ordered or unordered)."""
 
@@ -210,7 +354,7 @@ class List(ASTNode):
     def __init__(
         self, ordered: bool = False, start: int | None = None, tight: bool = True, **kwargs
     ):
-        super().__init__(type="list", **kwargs)
+        super(List, self).__init__(type=TYPE_LIST, **kwargs)
         self.ordered = ordered
         self.start = start
         self.tight = tight
@@ -219,47 +363,47 @@ class List(ASTNode):
             self.set_attr("start", start)
 
 
-@dataclass
+@dataclass(slots=True)
 class ListItem(ASTNode):
     """List item node."""
 
     def __init__(self, **kwargs):
-        super().__init__(type="list_item", **kwargs)
+        super(ListItem, self).__init__(type=TYPE_LIST_ITEM, **kwargs)
 
 
-@dataclass
+@dataclass(slots=True)
 class BlockQuote(ASTNode):
     """Block quote node."""
 
     def __init__(self, **kwargs):
-        super().__init__(type="blockquote", **kwargs)
+        super(BlockQuote, self).__init__(type=TYPE_BLOCKQUOTE, **kwargs)
 
 
-@dataclass
+@dataclass(slots=True)
 class HorizontalRule(ASTNode):
     """Horizontal rule node."""
 
     def __init__(self, **kwargs):
-        super().__init__(type="horizontal_rule", **kwargs)
+        super(HorizontalRule, self).__init__(type=TYPE_HORIZONTAL_RULE, **kwargs)
 
 
-@dataclass
+@dataclass(slots=True)
 class Table(ASTNode):
     """Table node."""
 
     def __init__(self, **kwargs):
-        super().__init__(type="table", **kwargs)
+        super(Table, self).__init__(type=TYPE_TABLE, **kwargs)
 
 
-@dataclass
+@dataclass(slots=True)
 class TableRow(ASTNode):
     """Table row node."""
 
     def __init__(self, **kwargs):
-        super().__init__(type="table_row", **kwargs)
+        super(TableRow, self).__init__(type=TYPE_TABLE_ROW, **kwargs)
 
 
-@dataclass
+@dataclass(slots=True)
 class TableCell(ASTNode):
     """Table cell node."""
 
@@ -267,7 +411,7 @@ class TableCell(ASTNode):
     align: str | None = None
 
     def __init__(self, header: bool = False, align: str | None = None, **kwargs):
-        super().__init__(type="table_cell", **kwargs)
+        super(TableCell, self).__init__(type=TYPE_TABLE_CELL, **kwargs)
         self.header = header
         self.align = align
         if align:
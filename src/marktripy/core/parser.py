@@ -3,12 +3,14 @@
 
 from __future__ import annotations
 
+import hashlib
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from typing import Any
 
 from loguru import logger
 
-from marktripy.core.ast import Document
+from marktripy.core.ast import _DEBUG, Document
 
 
 class Parser(ABC):
@@ -22,10 +24,16 @@ class Parser(ABC):
         """Initialize parser with optional configuration.
 
         Args:
-            config: Parser-specific configuration options
+            config: Parser-specific configuration options. All parsers accept:
+                - cache_size: Number of parsed documents to keep in an LRU
+                  cache keyed on the input text (default: 0, disabled)
         """
         self.config = config or {}
-        logger.debug(f"Initialized {self.__class__.__name__} with config: {self.config}")
+        self.cache_size = self.config.get("cache_size", 0)
+        self._parse_cache: OrderedDict[bytes, Document] = OrderedDict()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        logger.debug("Initialized {} with config: {}", self.__class__.__name__, self.config)
 
     @abstractmethod
     def parse(self, text: str) -> Document:
@@ -56,11 +64,31 @@ class Parser(ABC):
             - 'custom_extensions': Custom extension support
         """
 
+    def parse_and_validate(self, text: str) -> tuple[Document | None, list[str]]:
+        """Parse Markdown text and report validation errors in one pass.
+
+        Use this instead of ``validate_markdown`` followed by ``parse`` when
+        both the AST and the errors are needed. Default implementation just
+        tries to parse and catches exceptions. Subclasses can override for
+        more detailed validation.
+
+        Args:
+            text: The Markdown text to parse
+
+        Returns:
+            Tuple of the Document (None if parsing failed) and the list of
+            validation error messages (empty if valid)
+        """
+        try:
+            ast = self.parse(text)
+        except Exception as e:
+            return None, [str(e)]
+        return ast, []
+
     def validate_markdown(self, text: str) -> list[str]:
         """Validate Markdown syntax and return any errors.
 
-        Default implementation just tries to parse and catches exceptions.
-        Subclasses can override for more detailed validation.
+        Delegates to ``parse_and_validate`` and discards the AST.
 
         Args:
             text: The Markdown text to validate
@@ -68,12 +96,11 @@ class Parser(ABC):
         Returns:
             List of validation error messages (empty if valid)
         """
-        errors = []
-        try:
-            self.parse(text)
-        except Exception as e:
-            errors.append(str(e))
-        return errors
+        # A cached parse of the same text already succeeded
+        if self.cache_size and self._cache_key(text) in self._parse_cache:
+            return []
+
+        return self.parse_and_validate(text)[1]
 
     def preprocess(self, text: str) -> str:
         """Preprocess Markdown text before parsing.
@@ -87,21 +114,89 @@ class Parser(ABC):
         Returns:
             Preprocessed text ready for parsing
         """
-        # Normalize line endings
-        text = text.replace("\r\n", "\n").replace("\r", "\n")
+        # Normalize line endings; the scan skips both copies for LF-only input
+        if "\r" in text:
+            text = text.replace("\r\n", "\n")
+            if "\r" in text:
+                text = text.replace("\r", "\n")
 
         # Ensure text ends with newline
         if text and not text.endswith("\n"):
             text += "\n"
 
-        logger.debug(f"Preprocessed text: {len(text)} characters")
+        if _DEBUG:
+            logger.debug(f"Preprocessed text: {len(text)} characters")
         return text
 
+    @staticmethod
+    def _cache_key(text: str) -> bytes:
+        """Hash input text into a compact parse cache key."""
+        return hashlib.blake2b(text.encode(), digest_size=16).digest()
+
+    def _cache_lookup(self, text: str) -> Document | None:
+        """Return a copy of the cached AST for a text, if any.
+
+        Args:
+            text: Markdown text about to be parsed
+
+        Returns:
+            A fresh clone of the cached Document, or None on a miss or when
+            caching is disabled
+        """
+        if not self.cache_size:
+            return None
+        key = self._cache_key(text)
+        cached = self._parse_cache.get(key)
+        if cached is None:
+            self._cache_misses += 1
+            return None
+        self._parse_cache.move_to_end(key)
+        self._cache_hits += 1
+        return cached.clone()
+
+    def _cache_store(self, text: str, ast: Document) -> None:
+        """Remember the AST parsed from a text.
+
+        A private clone is stored, so callers may freely mutate the AST
+        they received.
+
+        Args:
+            text: Markdown text that was parsed
+            ast: The resulting AST
+        """
+        if not self.cache_size:
+            return
+        self._parse_cache[self._cache_key(text)] = ast.clone()
+        while len(self._parse_cache) > self.cache_size:
+            self._parse_cache.popitem(last=False)
+
+    def invalidate_cache(self) -> None:
+        """Drop all cached parse results."""
+        self._parse_cache.clear()
+        self._cache_hits = 0
+        self._cache_misses = 0
+
+    def cache_info(self) -> dict[str, int]:
+        """Get parse cache statistics.
+
+        Returns:
+            Dictionary with hits, misses, size and maxsize
+        """
+        return {
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "size": len(self._parse_cache),
+            "maxsize": self.cache_size,
+        }
+
     def postprocess(self, ast: Document) -> Document:
         """Postprocess AST after parsing.
 
         Can be overridden by subclasses to apply transformations,
-        validate the AST structure, or enrich nodes with metadata.
+        validate the AST structure, or enrich nodes with metadata. With
+        ``cache_size`` set, the postprocessed AST is what gets cached, so an
+        override runs once per distinct input text and must depend only on
+        the AST it receives.
 
         Args:
             ast: The parsed AST
@@ -109,7 +204,8 @@ class Parser(ABC):
         Returns:
             The postprocessed AST
         """
-        logger.debug(f"Postprocessed AST with {len(ast.children)} top-level nodes")
+        if _DEBUG:
+            logger.debug(f"Postprocessed AST with {len(ast.children)} top-level nodes")
         return ast
 
 
@@ -137,63 +233,77 @@ class ParserError(Exception):
         super().__init__(full_message)
 
 
-class ParserRegistry:
-    """Registry for available parser implementations."""
+# Registered parser classes by name
+_PARSERS: dict[str, type[Parser]] = {}
 
-    _parsers: dict[str, type[Parser]] = {}
 
-    @classmethod
-    def register(cls, name: str, parser_class: type[Parser]) -> None:
-        """Register a parser implementation.
+def register_parser(name: str, parser_class: type[Parser]) -> None:
+    """Register a parser implementation.
 
-        Args:
-            name: Name to register the parser under
-            parser_class: Parser class to register
-        """
-        if not issubclass(parser_class, Parser):
-            raise TypeError(f"{parser_class} must be a subclass of Parser")
+    Args:
+        name: Name to register the parser under
+        parser_class: Parser class to register
+    """
+    if not issubclass(parser_class, Parser):
+        raise TypeError(f"{parser_class} must be a subclass of Parser")
 
-        cls._parsers[name] = parser_class
-        logger.info(f"Registered parser: {name} -> {parser_class.__name__}")
+    _PARSERS[name] = parser_class
+    logger.info("Registered parser: {} -> {}", name, parser_class.__name__)
 
-    @classmethod
-    def get(cls, name: str) -> type[Parser]:
-        """Get a registered parser class.
 
-        Args:
-            name: Name of the parser to retrieve
+def get_parser(name: str) -> type[Parser]:
+    """Get a registered parser class.
 
-        Returns:
-            The parser class
+    Args:
+        name: Name of the parser to retrieve
 
-        Raises:
-            KeyError: If parser name is not registered
-        """
-        if name not in cls._parsers:
-            raise KeyError(
-                f"Parser '{name}' not registered. Available: {list(cls._parsers.keys())}"
-            )
-        return cls._parsers[name]
+    Returns:
+        The parser class
 
-    @classmethod
-    def create(cls, name: str, config: dict[str, Any] | None = None) -> Parser:
-        """Create a parser instance.
+    Raises:
+        KeyError: If parser name is not registered
+    """
+    try:
+        return _PARSERS[name]
+    except KeyError:
+        raise KeyError(f"Parser '{name}' not registered. Available: {list(_PARSERS)}") from None
 
-        Args:
-            name: Name of the parser to create
-            config: Parser configuration
 
-        Returns:
-            Parser instance
-        """
-        parser_class = cls.get(name)
-        return parser_class(config)
+def create_parser(name: str, config: dict[str, Any] | None = None) -> Parser:
+    """Create a parser instance.
 
-    @classmethod
-    def list_parsers(cls) -> list[str]:
-        """List all registered parser names.
+    Args:
+        name: Name of the parser to create
+        config: Parser configuration
 
-        Returns:
-            List of parser names
-        """
-        return list(cls._parsers.keys())
+    Returns:
+        Parser instance
+
+    Raises:
+        KeyError: If parser name is not registered
+    """
+    return get_parser(name)(config)
+
+
+def list_parsers() -> list[str]:
+    """List all registered parser names.
+
+    Returns:
+        List of parser names
+    """
+    return list(_PARSERS)
+
+
+class ParserRegistry:
+    """Registry for available parser implementations.
+
+    Thin wrapper over the module-level registry functions, kept for
+    backwards compatibility.
+    """
+
+    _parsers: dict[str, type[Parser]] = _PARSERS
+
+    register = staticmethod(register_parser)
+    get = staticmethod(get_parser)
+    create = staticmethod(create_parser)
+    list_parsers = staticmethod(list_parsers)
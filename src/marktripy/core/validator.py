@@ -3,6 +3,10 @@
 
 from __future__ import annotations
 
+import sys
+from collections.abc import Callable
+from typing import Any
+
 from loguru import logger
 
 from marktripy.core.ast import (
@@ -15,9 +19,9 @@ from marktripy.core.ast import (
     List,
     ListItem,
     Table,
-    TableCell,
     TableRow,
 )
+from marktripy.core.walker import ASTWalker
 
 
 class ValidationError(Exception):
@@ -40,15 +44,36 @@ class ValidationError(Exception):
 class ASTValidator:
     """Validates AST structure and content."""
 
-    def __init__(self, strict: bool = False):
+    def __init__(
+        self,
+        strict: bool = False,
+        on_error: Callable[[str, ASTNode], None] | None = None,
+    ):
         """Initialize validator.
 
         Args:
             strict: Whether to enforce strict validation rules
+            on_error: Called with the message and node of each error instead
+                of collecting ValidationError instances in ``errors``;
+                ``validate_strict`` still raises
         """
         self.strict = strict
+        self.on_error = on_error
         self.errors: list[ValidationError] = []
-        logger.debug(f"Initialized ASTValidator with strict={strict}")
+        self._raise_on_error = False
+
+        # Node type -> bound _validate_<type> method, resolved once so
+        # subclass overrides and additions are picked up. Keys are sliced
+        # from method names, so intern them to match the interned node types
+        # by identity.
+        prefix = "_validate_"
+        self._dispatch: dict[str, Callable[[Any], None]] = {
+            sys.intern(name[len(prefix) :]): getattr(self, name)
+            for name in dir(self)
+            if name.startswith(prefix)
+            and name not in ("_validate_node", "_validate_generic", "_validate_fallback")
+        }
+        logger.debug("Initialized ASTValidator with strict={}", strict)
 
     def validate(self, ast: Document) -> list[ValidationError]:
         """Validate an entire AST.
@@ -61,7 +86,7 @@ class ASTValidator:
         """
         self.errors = []
         self._validate_node(ast)
-        logger.info(f"Validation complete: {len(self.errors)} errors found")
+        logger.info("Validation complete: {} errors found", len(self.errors))
         return self.errors
 
     def validate_strict(self, ast: Document) -> None:
@@ -73,29 +98,74 @@ class ASTValidator:
         Raises:
             ValidationError: If validation fails
         """
-        errors = self.validate(ast)
-        if errors:
-            raise errors[0]
+        # Stop at the first error instead of collecting all of them
+        self.errors = []
+        self._raise_on_error = True
+        try:
+            self._validate_node(ast)
+        finally:
+            self._raise_on_error = False
 
-    def _validate_node(self, node: ASTNode) -> None:
-        """Validate a single node and its children.
+    def register_visitor(self, walker: ASTWalker) -> None:
+        """Validate as part of a shared traversal instead of a separate walk.
+
+        Clears previous errors; they accumulate in ``self.errors`` while the
+        walker runs. Unlike ``validate``, children of untyped nodes are still
+        visited.
+
+        Args:
+            walker: Walker that will drive the traversal
+        """
+        self.errors = []
+        walker.register(self._dispatch, self._validate_fallback)
+
+    def _validate_fallback(self, node: ASTNode) -> None:
+        """Validate a node whose type has no dedicated check.
 
         Args:
             node: The node to validate
         """
-        # Validate node structure
         if not node.type:
             self._add_error("Node has no type", node)
-            return
+        else:
+            self._validate_generic(node)
+
+    def _validate_node(self, node: ASTNode) -> None:
+        """Validate a node and all of its descendants.
 
-        # Type-specific validation
-        method_name = f"_validate_{node.type}"
-        validator = getattr(self, method_name, self._validate_generic)
-        validator(node)
+        Walks the subtree with an explicit stack in document order, so deep
+        trees cannot hit the recursion limit.
 
-        # Validate children
-        for child in node.children:
-            self._validate_node(child)
+        Args:
+            node: The node to validate
+        """
+        dispatch = self._dispatch
+        strict = self.strict
+        stack = [node]
+        while stack:
+            current = stack.pop()
+
+            # Validate node structure; children of an untyped node are skipped
+            if not current.type:
+                self._add_error("Node has no type", current)
+                continue
+
+            # Type-specific validation; unknown types only matter when strict
+            handler = dispatch.get(current.type)
+            if handler is not None:
+                handler(current)
+            elif strict:
+                self._validate_generic(current)
+
+            # Validate children, skipping typed leaves without a check
+            if strict:
+                stack.extend(reversed(current.children))
+            else:
+                stack.extend(
+                    child
+                    for child in reversed(current.children)
+                    if child.children or not child.type or child.type in dispatch
+                )
 
     def _add_error(self, message: str, node: ASTNode) -> None:
         """Add a validation error.
@@ -104,9 +174,16 @@ class ASTValidator:
             message: Error message
             node: The node with the error
         """
+        # Stream to the callback without building an exception object
+        if self.on_error is not None and not self._raise_on_error:
+            self.on_error(message, node)
+            return
+
         error = ValidationError(message, node)
         self.errors.append(error)
-        logger.warning(f"Validation error: {error}")
+        logger.warning("Validation error: {}", error)
+        if self._raise_on_error:
+            raise error
 
     def _validate_generic(self, node: ASTNode) -> None:
         """Generic validation for unknown node types.
@@ -115,7 +192,7 @@ class ASTValidator:
             node: The node to validate
         """
         if self.strict:
-            logger.warning(f"Unknown node type in strict mode: {node.type}")
+            logger.warning("Unknown node type in strict mode: {}", node.type)
 
     def _validate_document(self, node: Document) -> None:
         """Validate document node.
@@ -202,11 +279,17 @@ class ASTValidator:
             if child.type != "table_row":
                 self._add_error(f"Table contains non-row: {child.type}", child)
 
-        # Validate table structure
-        if node.children:
-            row_lengths = [len(row.children) for row in node.children if isinstance(row, TableRow)]
-            if row_lengths and len(set(row_lengths)) > 1:
+        # Validate table structure against the first row's column count
+        first = None
+        for row in node.children:
+            if not isinstance(row, TableRow):
+                continue
+            columns = len(row.children)
+            if first is None:
+                first = columns
+            elif columns != first:
                 self._add_error("Table has inconsistent column counts", node)
+                break
 
     def _validate_table_row(self, node: TableRow) -> None:
         """Validate table row node.
@@ -219,15 +302,6 @@ class ASTValidator:
             if child.type != "table_cell":
                 self._add_error(f"Table row contains non-cell: {child.type}", child)
 
-    def _validate_table_cell(self, node: TableCell) -> None:
-        """Validate table cell node.
-
-        Args:
-            node: Table cell node to validate
-        """
-        # Cells can contain any content
-        pass
-
     def _validate_blockquote(self, node: BlockQuote) -> None:
         """Validate blockquote node.
 
@@ -0,0 +1,62 @@
+# this_file: marktripy/core/walker.py
+"""Single-pass AST traversal shared by several visitors."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+
+from marktripy.core.ast import ASTNode
+
+NodeVisitor = Callable[[ASTNode], None]
+
+
+class ASTWalker:
+    """Runs several node visitors over an AST in one traversal.
+
+    Each registered visitor maps node types to callables. Walking the tree
+    once and dispatching every node to all visitors replaces one full
+    traversal per visitor, e.g. an extension transform followed by
+    validation.
+    """
+
+    def __init__(self) -> None:
+        """Initialize a walker with no visitors."""
+        self._visitors: list[tuple[Mapping[str, NodeVisitor], NodeVisitor | None]] = []
+
+    def register(
+        self, visitor: Mapping[str, NodeVisitor], default: NodeVisitor | None = None
+    ) -> None:
+        """Register a visitor.
+
+        Visitors are called in registration order for each node.
+
+        Args:
+            visitor: Mapping of node type to the callable handling it
+            default: Callable for node types missing from the mapping
+        """
+        self._visitors.append((visitor, default))
+
+    def walk(self, ast: ASTNode) -> ASTNode:
+        """Dispatch every node of a tree to the registered visitors.
+
+        Nodes are visited depth-first in document order. Children are read
+        after all visitors have seen their parent, so a visitor may rewrite
+        a node's children and the walk continues into the new ones.
+
+        Args:
+            ast: Root of the tree to walk
+
+        Returns:
+            The same root node
+        """
+        visitors = self._visitors
+        stack = [ast]
+        while stack:
+            node = stack.pop()
+            node_type = node.type
+            for handlers, default in visitors:
+                handler = handlers.get(node_type, default)
+                if handler is not None:
+                    handler(node)
+            stack.extend(reversed(node.children))
+        return ast
@@ -10,6 +10,8 @@ from loguru import logger
 
 from marktripy.core.ast import ASTNode
 from marktripy.core.parser import Parser
+from marktripy.core.validator import ASTValidator
+from marktripy.core.walker import ASTWalker, NodeVisitor
 from marktripy.renderers.base import Renderer
 
 
@@ -28,7 +30,7 @@ class Extension(ABC):
         """
         self.config = config or {}
         self.name = self.get_name()
-        logger.debug(f"Initialized extension '{self.name}' with config: {self.config}")
+        logger.debug("Initialized extension '{}' with config: {}", self.name, self.config)
 
     @abstractmethod
     def get_name(self) -> str:
@@ -87,6 +89,38 @@ class Extension(ABC):
         """
         return ast
 
+    def get_node_visitor(self) -> dict[str, NodeVisitor] | None:
+        """Get per-node handlers that implement ``transform_ast``.
+
+        Override this alongside ``transform_ast`` when the transformation
+        only touches one node at a time. The extension manager then runs it
+        in a traversal shared with other extensions and validation instead
+        of a separate walk over the whole tree.
+
+        Returns:
+            Mapping of node type to handler, or None to always use
+            ``transform_ast``
+        """
+        return None
+
+    def _overrides_transform(self, owner: type[Extension], *names: str) -> bool:
+        """Check whether a subclass changed how ``transform_ast`` works.
+
+        A node visitor stands in for ``transform_ast``, so it must not be
+        used once a subclass overrides it or the methods it relies on.
+
+        Args:
+            owner: Class that provides the node visitor
+            *names: Methods of ``owner`` that the node visitor replaces
+
+        Returns:
+            True if ``transform_ast`` or one of ``names`` is overridden
+        """
+        cls = type(self)
+        return any(
+            getattr(cls, name) is not getattr(owner, name) for name in ("transform_ast", *names)
+        )
+
     def register_html_renderer(self, renderer: Renderer) -> None:  # noqa: B027
         """Register HTML rendering methods.
 
@@ -129,8 +163,32 @@ class ExtensionManager:
         """Initialize the extension manager."""
         self.extensions: dict[str, Extension] = {}
         self.load_order: list[str] = []
+        # Extensions that override each hook, in load order
+        self._inline_hooks: list[Extension] = []
+        self._block_hooks: list[Extension] = []
+        self._ast_hooks: list[Extension] = []
+        self._html_hooks: list[Extension] = []
+        self._md_hooks: list[Extension] = []
         logger.debug("Initialized ExtensionManager")
 
+    def _rebuild_hooks(self) -> None:
+        """Recompute the per-hook extension lists from the load order.
+
+        Extensions whose class does not override a hook are left out of that
+        hook's list, so applying it never calls the no-op base method.
+        """
+        extensions = [self.extensions[name] for name in self.load_order]
+
+        def overriding(hook: str) -> list[Extension]:
+            base = getattr(Extension, hook)
+            return [ext for ext in extensions if getattr(type(ext), hook) is not base]
+
+        self._inline_hooks = overriding("register_inline_rule")
+        self._block_hooks = overriding("register_block_rule")
+        self._ast_hooks = overriding("transform_ast")
+        self._html_hooks = overriding("register_html_renderer")
+        self._md_hooks = overriding("register_markdown_renderer")
+
     def register(self, extension: Extension) -> None:
         """Register an extension.
 
@@ -151,8 +209,9 @@ class ExtensionManager:
 
         self.extensions[name] = extension
         self.load_order.append(name)
+        self._rebuild_hooks()
         extension.setup()
-        logger.info(f"Registered extension: {name}")
+        logger.info("Registered extension: {}", name)
 
     def unregister(self, name: str) -> None:
         """Unregister an extension.
@@ -177,7 +236,8 @@ class ExtensionManager:
         extension.teardown()
         del self.extensions[name]
         self.load_order.remove(name)
-        logger.info(f"Unregistered extension: {name}")
+        self._rebuild_hooks()
+        logger.info("Unregistered extension: {}", name)
 
     def get(self, name: str) -> Extension:
         """Get a registered extension.
@@ -209,26 +269,56 @@ class ExtensionManager:
         Args:
             parser: Parser to extend
         """
-        for name in self.load_order:
-            extension = self.extensions[name]
+        for extension in self._inline_hooks:
             extension.register_inline_rule(parser)
+        for extension in self._block_hooks:
             extension.register_block_rule(parser)
-            logger.debug(f"Applied parser extensions from '{name}'")
-
-    def apply_ast_transformations(self, ast: ASTNode) -> ASTNode:
+        logger.debug("Applied parser extensions")
+
+    def apply_ast_transformations(
+        self,
+        ast: ASTNode,
+        freeze: bool = False,
+        validator: ASTValidator | None = None,
+    ) -> ASTNode:
         """Apply all AST transformations from extensions.
 
+        Consecutive extensions that provide a node visitor are run together
+        in a single traversal; the others run their own ``transform_ast`` in
+        between, so the load order is preserved.
+
         Args:
             ast: AST to transform
+            freeze: Whether to freeze the result (see ASTNode.freeze) once all
+                transformations have run; use when the tree will only be rendered
+            validator: Validator to run in the same traversal as the last
+                transformations; errors are left in ``validator.errors``
 
         Returns:
             Transformed AST
         """
         result = ast
-        for name in self.load_order:
-            extension = self.extensions[name]
+        walker: ASTWalker | None = None
+        for extension in self._ast_hooks:
+            visitor = extension.get_node_visitor()
+            if visitor is not None:
+                if walker is None:
+                    walker = ASTWalker()
+                walker.register(visitor)
+                continue
+            if walker is not None:
+                walker.walk(result)
+                walker = None
             result = extension.transform_ast(result)
-            logger.debug(f"Applied AST transformation from '{name}'")
+            logger.debug("Applied AST transformation from '{}'", extension.name)
+        if validator is not None:
+            if walker is None:
+                walker = ASTWalker()
+            validator.register_visitor(walker)
+        if walker is not None:
+            walker.walk(result)
+        if freeze:
+            result.freeze()
         return result
 
     def apply_renderer_extensions(self, renderer: Renderer, format: str = "html") -> None:
@@ -238,10 +328,10 @@ class ExtensionManager:
             renderer: Renderer to extend
             format: Output format ('html' or 'markdown')
         """
-        for name in self.load_order:
-            extension = self.extensions[name]
-            if format == "html":
+        if format == "html":
+            for extension in self._html_hooks:
                 extension.register_html_renderer(renderer)
-            elif format == "markdown":
+        elif format == "markdown":
+            for extension in self._md_hooks:
                 extension.register_markdown_renderer(renderer)
-            logger.debug(f"Applied {format} renderer extensions from '{name}'")
+        logger.debug("Applied {} renderer extensions", format)
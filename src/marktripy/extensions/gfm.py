@@ -70,9 +70,24 @@ class GFMExtension(Extension):
         Returns:
             Transformed AST
         """
-        # Apply transformations in order
-        ast = self.strikethrough.transform_ast(ast)
-        return self.tasklist.transform_ast(ast)
+        return self.transform_ast_fused(ast)
+
+    def transform_ast_fused(self, ast: ASTNode) -> ASTNode:
+        """Apply the strikethrough and task list transformations in one walk.
+
+        Running each sub-extension's transform_ast would traverse the whole
+        tree once per feature; here both per-node hooks run on each node.
+
+        Args:
+            ast: AST to transform
+
+        Returns:
+            Transformed AST
+        """
+        for node in ast.iter_walk():
+            self.strikethrough.transform_node(node)
+            self.tasklist.transform_node(node)
+        return ast
 
     def register_html_renderer(self, renderer: Any) -> None:
         """Register HTML rendering methods.
@@ -7,24 +7,33 @@ Provides support for ++key++ syntax to render keyboard keys.
 from __future__ import annotations
 
 import re
+import sys
 from typing import Any
 
 from loguru import logger
 
-from marktripy.core.ast import ASTNode, Text
+from marktripy.core.ast import ASTNode, Text, make_text
 from marktripy.extensions.base import Extension
+from marktripy.renderers.base import HTML_ESCAPE_TABLE
+
+TYPE_KEYBOARD_KEY = sys.intern("keyboard_key")
+
+# Matches ++key++; allows empty keys
+_KBD_RE = re.compile(r"\+\+([^+]*)\+\+")
 
 
 class KeyboardKey(ASTNode):
     """AST node for keyboard keys."""
 
+    __slots__ = ("key",)
+
     def __init__(self, key: str):
         """Initialize keyboard key node.
 
         Args:
             key: The key text to display
         """
-        super().__init__(type="keyboard_key", content=key)
+        super().__init__(type=TYPE_KEYBOARD_KEY, content=key)
         self.key = key
 
 
@@ -64,8 +73,38 @@ class KbdExtension(Extension):
         self._transform_node(ast)
         return ast
 
-    def _transform_node(self, node: ASTNode) -> list[ASTNode] | None:
-        """Transform a node and its children, returning replacement nodes if needed.
+    def _transform_node(self, node: ASTNode) -> None:
+        """Replace ++key++ patterns in every Text node below a node.
+
+        Replaced children are swapped in before the walk descends, so the
+        walk continues into the new nodes.
+
+        Args:
+            node: Root of the subtree to process
+        """
+        for current in node.iter_walk():
+            # Leaves (most Text nodes) have nothing to rewrite
+            if not current.children:
+                continue
+            # Only copy the children list once a replacement is actually needed
+            new_children = None
+            for i, child in enumerate(current.children):
+                parts = self._split_text(child)
+                if parts is not None:
+                    # Child was replaced with new nodes
+                    if new_children is None:
+                        new_children = current.children[:i]
+                    new_children.extend(parts)
+                elif new_children is not None:
+                    # Keep original child
+                    new_children.append(child)
+
+            # Update node's children if any were replaced
+            if new_children is not None:
+                current.children = new_children
+
+    def _split_text(self, node: ASTNode) -> list[ASTNode] | None:
+        """Split a Text node around its ++key++ patterns.
 
         Args:
             node: Node to process
@@ -73,50 +112,30 @@ class KbdExtension(Extension):
         Returns:
             List of replacement nodes, or None if no replacement needed
         """
-        # First, transform all children
-        new_children = []
-        for child in node.children:
-            result = self._transform_node(child)
-            if result is not None:
-                # Child was replaced with new nodes
-                new_children.extend(result)
-            else:
-                # Keep original child
-                new_children.append(child)
-
-        # Update node's children if any were replaced
-        if len(new_children) != len(node.children) or any(
-            new_children[i] is not node.children[i] for i in range(len(new_children))
-        ):
-            node.children = new_children
-
-        # Now check if this node itself needs transformation
-        if isinstance(node, Text) and node.content:
-            # Look for ++key++ patterns
-            # Updated pattern to handle empty keys and be more flexible
-            pattern = r"\+\+([^+]*)\+\+"
-            parts = []
-            last_end = 0
-
-            for match in re.finditer(pattern, node.content):
-                # Add text before the match
-                if match.start() > last_end:
-                    parts.append(Text(content=node.content[last_end : match.start()]))
-
-                # Add keyboard key node
-                parts.append(KeyboardKey(key=match.group(1)))
-                last_end = match.end()
-
-            # Add remaining text
-            if last_end < len(node.content):
-                parts.append(Text(content=node.content[last_end:]))
-
-            # If we found any matches, return the replacement nodes
-            if len(parts) > 1:
-                return parts
-
-        # No replacement needed
-        return None
+        if not isinstance(node, Text):
+            return None
+        content = node.content
+        # Cheap substring scan and a single search rule out the common case
+        # before any replacement nodes are allocated
+        if not content or "++" not in content or _KBD_RE.search(content) is None:
+            return None
+
+        parts: list[ASTNode] = []
+        last_end = 0
+        for match in _KBD_RE.finditer(content):
+            # Add text before the match
+            if match.start() > last_end:
+                parts.append(make_text(content[last_end : match.start()]))
+
+            # Add keyboard key node
+            parts.append(KeyboardKey(key=match.group(1)))
+            last_end = match.end()
+
+        # Add remaining text
+        if last_end < len(content):
+            parts.append(make_text(content[last_end:]))
+
+        return parts
 
     def register_html_renderer(self, renderer: Any) -> None:
         """Register HTML rendering for keyboard keys.
@@ -124,15 +143,7 @@ class KbdExtension(Extension):
         Args:
             renderer: HTML renderer to extend
         """
-
-        def render_keyboard_key(node: KeyboardKey) -> str:
-            """Render keyboard key as HTML."""
-            # Escape HTML in the key text
-            key = node.key.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
-            return f"<kbd>{key}</kbd>"
-
-        # Register the render method
-        renderer.render_keyboard_key = render_keyboard_key
+        renderer.render_keyboard_key = _render_keyboard_key_html
         logger.debug("Registered kbd HTML renderer")
 
     def register_markdown_renderer(self, renderer: Any) -> None:
@@ -141,13 +152,18 @@ class KbdExtension(Extension):
         Args:
             renderer: Markdown renderer to extend
         """
+        renderer.render_keyboard_key = _render_keyboard_key_markdown
+        logger.debug("Registered kbd Markdown renderer")
 
-        def render_keyboard_key(node: KeyboardKey) -> str:
-            """Render keyboard key back to Markdown."""
-            # Escape any + characters in the key
-            key = node.key.replace("+", "\\+")
-            return f"++{key}++"
 
-        # Register the render method
-        renderer.render_keyboard_key = render_keyboard_key
-        logger.debug("Registered kbd Markdown renderer")
+def _render_keyboard_key_html(node: KeyboardKey) -> str:
+    """Render keyboard key as HTML."""
+    # Escape HTML in the key text
+    return f"<kbd>{node.key.translate(HTML_ESCAPE_TABLE)}</kbd>"
+
+
+def _render_keyboard_key_markdown(node: KeyboardKey) -> str:
+    """Render keyboard key back to Markdown."""
+    # Escape any + characters in the key
+    key = node.key.replace("+", "\\+")
+    return f"++{key}++"
@@ -6,20 +6,23 @@ Provides support for ~~strikethrough~~ syntax as used in GitHub Flavored Markdow
 
 from __future__ import annotations
 
+from types import MethodType
 from typing import Any
 
 from loguru import logger
 
-from marktripy.core.ast import ASTNode
+from marktripy.core.ast import TYPE_STRIKETHROUGH, ASTNode
 from marktripy.extensions.base import Extension
 
 
 class Strikethrough(ASTNode):
     """AST node for strikethrough text."""
 
-    def __init__(self):
+    __slots__ = ()
+
+    def __init__(self) -> None:
         """Initialize strikethrough node."""
-        super().__init__(type="strikethrough")
+        super().__init__(type=TYPE_STRIKETHROUGH)
 
 
 class StrikethroughExtension(Extension):
@@ -55,41 +58,38 @@ class StrikethroughExtension(Extension):
         return ast
 
     def _transform_strikethrough_nodes(self, node: ASTNode) -> None:
-        """Recursively transform generic strikethrough nodes to our Strikethrough type.
+        """Transform generic strikethrough nodes to our Strikethrough type.
+
+        Uses the iterative tree walk; replacements are made before the walk
+        descends into them.
 
         Args:
             node: Node to process
         """
-        # Check if this is a generic strikethrough node created by the parser
-        if node.type == "strikethrough" and not isinstance(node, Strikethrough):
-            # Create a proper Strikethrough node
-            new_node = Strikethrough()
-            # Copy children
-            new_node.children = node.children
-            # Copy attributes
-            new_node.attrs = node.attrs
-            new_node.meta = node.meta
-
-            # Replace this node in its parent
-            if hasattr(node, "parent") and node.parent:
-                try:
-                    index = node.parent.children.index(node)
-                    node.parent.children[index] = new_node
-                except (ValueError, AttributeError):
-                    pass
-
-        # Process children
-        for i, child in enumerate(list(node.children)):
-            if child.type == "strikethrough" and not isinstance(child, Strikethrough):
+        for current in node.iter_walk():
+            self.transform_node(current)
+
+    def transform_node(self, node: ASTNode) -> None:
+        """Replace generic strikethrough children of a single node.
+
+        Does not descend; callers drive the traversal.
+
+        Args:
+            node: Node whose children to process
+        """
+        # Leaves have no children to rewrite
+        if not node.children:
+            return
+        # Children are only reassigned in place, never added or removed,
+        # so iterating the live list is safe
+        for i, child in enumerate(node.children):
+            if child.type == TYPE_STRIKETHROUGH and not isinstance(child, Strikethrough):
                 # Replace with proper Strikethrough node
                 new_node = Strikethrough()
                 new_node.children = child.children
                 new_node.attrs = child.attrs
                 new_node.meta = child.meta
                 node.children[i] = new_node
-                self._transform_strikethrough_nodes(new_node)
-            else:
-                self._transform_strikethrough_nodes(child)
 
     def register_html_renderer(self, renderer: Any) -> None:
         """Register HTML rendering for strikethrough.
@@ -97,14 +97,7 @@ class StrikethroughExtension(Extension):
         Args:
             renderer: HTML renderer to extend
         """
-
-        def render_strikethrough(node: Strikethrough) -> str:
-            """Render strikethrough as HTML."""
-            content = renderer.render_children(node)
-            return f"<del>{content}</del>"
-
-        # Register the render method
-        renderer.render_strikethrough = render_strikethrough
+        renderer.render_strikethrough = MethodType(_render_strikethrough_html, renderer)
         logger.debug("Registered strikethrough HTML renderer")
 
     def register_markdown_renderer(self, renderer: Any) -> None:
@@ -113,12 +106,17 @@ class StrikethroughExtension(Extension):
         Args:
             renderer: Markdown renderer to extend
         """
+        renderer.render_strikethrough = MethodType(_render_strikethrough_markdown, renderer)
+        logger.debug("Registered strikethrough Markdown renderer")
 
-        def render_strikethrough(node: Strikethrough) -> str:
-            """Render strikethrough back to Markdown."""
-            content = renderer.render_children(node)
-            return f"~~{content}~~"
 
-        # Register the render method
-        renderer.render_strikethrough = render_strikethrough
-        logger.debug("Registered strikethrough Markdown renderer")
+def _render_strikethrough_html(renderer: Any, node: Strikethrough) -> str:
+    """Render strikethrough as HTML."""
+    content = renderer.render_children(node)
+    return f"<del>{content}</del>"
+
+
+def _render_strikethrough_markdown(renderer: Any, node: Strikethrough) -> str:
+    """Render strikethrough back to Markdown."""
+    content = renderer.render_children(node)
+    return f"~~{content}~~"
@@ -8,14 +8,22 @@ Provides support for GitHub-style task lists:
 
 from __future__ import annotations
 
-import re
+from types import MethodType
 from typing import Any
 
 from loguru import logger
 
-from marktripy.core.ast import ASTNode, ListItem, Text
+from marktripy.core.ast import TYPE_LIST_ITEM, TYPE_TEXT, ASTNode, ListItem
+from marktripy.core.walker import NodeVisitor
 from marktripy.extensions.base import Extension
 
+# Rendered checkboxes by checked state
+_CHECKBOX_HTML = {
+    True: '<input type="checkbox" disabled checked>',
+    False: '<input type="checkbox" disabled>',
+}
+_CHECKBOX_MARKDOWN = {True: "[x]", False: "[ ]"}
+
 
 class TaskListExtension(Extension):
     """Extension that adds support for task list syntax."""
@@ -40,42 +48,64 @@ class TaskListExtension(Extension):
         self._transform_list_items(ast)
         return ast
 
+    def get_node_visitor(self) -> dict[str, NodeVisitor] | None:
+        """Get the per-node handler for shared traversals.
+
+        Subclasses that override ``transform_ast`` keep their own pass.
+
+        Returns:
+            Mapping of the list item type to ``transform_node``, or None
+        """
+        if self._overrides_transform(TaskListExtension, "_transform_list_items"):
+            return None
+        return {TYPE_LIST_ITEM: self.transform_node}
+
     def _transform_list_items(self, node: ASTNode) -> None:
-        """Recursively transform list items to detect task list syntax.
+        """Transform all list items below a node to detect task list syntax.
+
+        Args:
+            node: Node to process
+        """
+        for current in node.iter_walk():
+            self.transform_node(current)
+
+    def transform_node(self, node: ASTNode) -> None:
+        """Mark a single list item as a task if it starts with [ ] or [x].
+
+        Does not descend; callers drive the traversal.
 
         Args:
             node: Node to process
         """
-        if isinstance(node, ListItem) and node.children and len(node.children) > 0:
+        # Type tags are interned, so these checks are identity compares
+        # rather than isinstance() walks over the MRO
+        if node.type == TYPE_LIST_ITEM and node.children:
             # Check if the first child contains task list syntax
             first_child = node.children[0]
 
-            # Check if it's a paragraph or text node
-            if hasattr(first_child, "children") and first_child.children:
-                text_node = first_child.children[0]
-            elif isinstance(first_child, Text):
-                text_node = first_child
-            else:
-                text_node = None
-
-            if text_node and isinstance(text_node, Text) and text_node.content:
-                # Look for task list pattern at the start
-                match = re.match(r"^\[([ xX])\]\s+(.*)$", text_node.content)
-                if match:
-                    # It's a task list item
-                    checked = match.group(1).lower() == "x"
-                    remaining_text = match.group(2)
-
-                    # Set task list attributes
-                    node.set_attr("task", True)
-                    node.set_attr("checked", checked)
-
-                    # Update the text content
-                    text_node.content = remaining_text
-
-        # Process children
-        for child in node.children:
-            self._transform_list_items(child)
+            # Look inside a paragraph, or at a bare text node
+            text_node = first_child.children[0] if first_child.children else first_child
+            if text_node.type != TYPE_TEXT or not text_node.content:
+                return
+
+            # Check the "[ ] " / "[x] " marker character by character. The text
+            # may span several lines, as parsers merge adjacent text nodes
+            content = text_node.content
+            if (
+                len(content) < 4
+                or content[0] != "["
+                or content[2] != "]"
+                or content[1] not in " xX"
+                or not content[3].isspace()
+            ):
+                return
+
+            # Set task list attributes
+            node.set_attr("task", True)
+            node.set_attr("checked", content[1] != " ")
+
+            # Drop the marker and the whitespace after it
+            text_node.content = content[3:].lstrip()
 
     def register_html_renderer(self, renderer: Any) -> None:
         """Register HTML rendering for task lists.
@@ -83,26 +113,7 @@ class TaskListExtension(Extension):
         Args:
             renderer: HTML renderer to extend
         """
-        # Store the original render_list_item method
-        original_render_list_item = renderer.render_list_item
-
-        def render_list_item(node: ListItem) -> str:
-            """Render list item with task list support."""
-            if node.get_attr("task"):
-                # It's a task list item
-                checked = node.get_attr("checked", False)
-                checkbox = f'<input type="checkbox" disabled{"" if not checked else " checked"}>'
-
-                # Render children
-                content = renderer.render_children(node)
-
-                # Wrap in list item with checkbox
-                return f"<li>{checkbox} {content}</li>"
-            # Regular list item
-            return original_render_list_item(node)
-
-        # Replace the render method
-        renderer.render_list_item = render_list_item
+        renderer._list_item_renderers[True] = MethodType(_render_task_item_html, renderer)
         logger.debug("Registered task list HTML renderer")
 
     def register_markdown_renderer(self, renderer: Any) -> None:
@@ -111,28 +122,24 @@ class TaskListExtension(Extension):
         Args:
             renderer: Markdown renderer to extend
         """
-        # Store the original render_list_item method
-        original_render_list_item = renderer.render_list_item
-
-        def render_list_item(node: ListItem) -> str:
-            """Render list item with task list support."""
-            if node.get_attr("task"):
-                # It's a task list item
-                checked = node.get_attr("checked", False)
-                checkbox = "[x]" if checked else "[ ]"
-
-                # Render children
-                content = renderer.render_children(node)
-
-                # Strip extra newlines for tight lists
-                if renderer.context.tight_list:
-                    content = content.strip()
-
-                # Prepend checkbox
-                return f"{checkbox} {content}"
-            # Regular list item
-            return original_render_list_item(node)
-
-        # Replace the render method
-        renderer.render_list_item = render_list_item
+        renderer._list_item_renderers[True] = MethodType(_render_task_item_markdown, renderer)
         logger.debug("Registered task list Markdown renderer")
+
+
+def _render_task_item_html(renderer: Any, node: ListItem) -> str:
+    """Render a task list item as HTML with a checkbox."""
+    checkbox = _CHECKBOX_HTML[bool(node.get_attr("checked", False))]
+    content = renderer.render_children(node)
+    return f"<li>{checkbox} {content}</li>"
+
+
+def _render_task_item_markdown(renderer: Any, node: ListItem) -> str:
+    """Render a task list item as Markdown with a checkbox."""
+    checkbox = _CHECKBOX_MARKDOWN[bool(node.get_attr("checked", False))]
+    content = renderer.render_children(node)
+
+    # Strip extra newlines for tight lists
+    if renderer.context.tight_list:
+        content = content.strip()
+
+    return f"{checkbox} {content}"
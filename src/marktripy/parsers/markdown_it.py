@@ -3,13 +3,16 @@
 
 from __future__ import annotations
 
-from typing import Any
+from collections.abc import Callable
+from typing import Any, Final
 
 from loguru import logger
 from markdown_it import MarkdownIt
 from markdown_it.token import Token
 
 from marktripy.core.ast import (
+    TYPE_STRIKETHROUGH,
+    TYPE_TEXT,
     ASTNode,
     BlockQuote,
     CodeBlock,
@@ -27,7 +30,7 @@ from marktripy.core.ast import (
     Table,
     TableCell,
     TableRow,
-    Text,
+    make_text,
 )
 from marktripy.core.parser import Parser, ParserError, ParserRegistry
 
@@ -45,6 +48,8 @@ class MarkdownItParser(Parser):
                 - plugins: List of plugin names to enable
                 - disable: List of rule names to disable
                 - enable: List of rule names to enable
+                - share_text: Reuse cached Text nodes for very short leaves;
+                  the resulting AST must be treated as read-only
         """
         super().__init__(config)
 
@@ -54,6 +59,44 @@ class MarkdownItParser(Parser):
         plugins = self.config.get("plugins", [])
         disable_rules = self.config.get("disable", [])
         enable_rules = self.config.get("enable", [])
+        self.share_text = bool(self.config.get("share_text", False))
+        # Built on first use; reset by enable() and disable()
+        self._capabilities_cache: dict[str, bool] | None = None
+
+        # Node builders keyed by token type. Closing tags, structural tokens
+        # (thead, tbody) and unsupported tokens have no entry and are skipped.
+        self._token_builders: Final[dict[str, Callable[[Token], ASTNode | None]]] = {
+            # Content tokens
+            "text": self._build_text,
+            "code_inline": lambda token: InlineCode(content=token.content),
+            "softbreak": self._build_break,
+            "hardbreak": self._build_break,
+            "html_inline": lambda token: make_text(token.content),
+            "html_block": lambda token: make_text(token.content),
+            # Block tokens
+            "heading_open": self._build_heading,
+            "paragraph_open": lambda _token: Paragraph(),
+            "blockquote_open": lambda _token: BlockQuote(),
+            "hr": lambda _token: HorizontalRule(),
+            "fence": self._build_code_block,
+            "code_block": self._build_code_block,
+            # List tokens
+            "bullet_list_open": self._build_bullet_list,
+            "ordered_list_open": self._build_ordered_list,
+            "list_item_open": self._build_list_item,
+            # Inline tokens
+            "em_open": lambda _token: Emphasis(),
+            "strong_open": lambda _token: Strong(),
+            # Generic strikethrough node, specialized by StrikethroughExtension
+            "s_open": lambda _token: ASTNode(type=TYPE_STRIKETHROUGH),
+            "link_open": self._build_link,
+            "image": self._build_image,
+            # Table tokens
+            "table_open": lambda _token: Table(),
+            "tr_open": lambda _token: TableRow(),
+            "th_open": self._build_table_cell,
+            "td_open": self._build_table_cell,
+        }
 
         # Initialize markdown-it
         self.md = MarkdownIt(preset, options)
@@ -72,7 +115,7 @@ class MarkdownItParser(Parser):
         # Load plugins if available
         self._load_plugins(plugins)
 
-        logger.info(f"Initialized MarkdownItParser with preset '{preset}'")
+        logger.info("Initialized MarkdownItParser with preset '{}'", preset)
 
     def _load_plugins(self, plugins: list[str]) -> None:
         """Load markdown-it-py plugins.
@@ -103,10 +146,36 @@ class MarkdownItParser(Parser):
 
                     self.md.use(attrs_plugin)
                 else:
-                    logger.warning(f"Unknown plugin: {plugin_name}")
-                logger.debug(f"Loaded plugin: {plugin_name}")
+                    logger.warning("Unknown plugin: {}", plugin_name)
+                logger.debug("Loaded plugin: {}", plugin_name)
             except ImportError:
-                logger.error(f"Failed to import plugin: {plugin_name}")
+                logger.error("Failed to import plugin: {}", plugin_name)
+
+    def enable(self, names: str | list[str]) -> None:
+        """Enable markdown-it rules.
+
+        Use this rather than ``self.md.enable`` so that cached capabilities
+        and parse results are discarded.
+
+        Args:
+            names: Rule name or list of rule names
+        """
+        self.md.enable(names)
+        self._capabilities_cache = None
+        self.invalidate_cache()
+
+    def disable(self, names: str | list[str]) -> None:
+        """Disable markdown-it rules.
+
+        Use this rather than ``self.md.disable`` so that cached capabilities
+        and parse results are discarded.
+
+        Args:
+            names: Rule name or list of rule names
+        """
+        self.md.disable(names)
+        self._capabilities_cache = None
+        self.invalidate_cache()
 
     def parse(self, text: str) -> Document:
         """Parse Markdown text into an AST.
@@ -117,22 +186,29 @@ class MarkdownItParser(Parser):
         Returns:
             The root Document node of the AST
         """
+        cached = self._cache_lookup(text)
+        if cached is not None:
+            return cached
+
         try:
             # Preprocess text
-            text = self.preprocess(text)
+            source = self.preprocess(text)
 
             # Parse to tokens
-            tokens = self.md.parse(text)
+            tokens = self.md.parse(source)
 
             # Convert tokens to AST
             doc = self._tokens_to_ast(tokens)
 
             # Postprocess AST
-            return self.postprocess(doc)
+            doc = self.postprocess(doc)
 
         except Exception as e:
             raise ParserError(f"Failed to parse Markdown: {e}") from e
 
+        self._cache_store(text, doc)
+        return doc
+
     def _tokens_to_ast(self, tokens: list[Token]) -> Document:
         """Convert markdown-it tokens to AST.
 
@@ -143,106 +219,64 @@ class MarkdownItParser(Parser):
             Document node with AST
         """
         doc = Document()
-        self._process_tokens(tokens, doc)
+        # Drop hidden tokens (e.g. paragraphs in tight lists) up front;
+        # markdown-it only hides block-level tokens
+        self._process_tokens([t for t in tokens if not t.hidden], doc)
         return doc
 
-    def _process_tokens(self, tokens: list[Token], parent: ASTNode, start_idx: int = 0) -> int:
-        """Process tokens and build AST recursively.
-
-        Args:
-            tokens: List of tokens to process
-            parent: Parent node to add children to
-            start_idx: Starting index in token list
-
-        Returns:
-            Index after processed tokens
-        """
-        i = start_idx
-
-        while i < len(tokens):
-            token = tokens[i]
-
-            # Skip hidden tokens
-            if token.hidden:
-                i += 1
-                continue
-
-            # Handle opening tags
-            if token.nesting == 1:
-                node = self._create_node_from_token(token)
-                if node:
-                    parent.add_child(node)
-                    # Process children for container nodes
-                    if token.type in [
-                        "bullet_list_open",
-                        "ordered_list_open",
-                        "list_item_open",
-                        "blockquote_open",
-                        "table_open",
-                        "thead_open",
-                        "tbody_open",
-                        "tr_open",
-                        "th_open",
-                        "td_open",
-                        "heading_open",
-                        "paragraph_open",
-                        "em_open",
-                        "strong_open",
-                        "s_open",
-                        "link_open",
-                    ]:
-                        i = self._process_tokens(tokens, node, i + 1)
-                        continue
-
-            # Handle closing tags
-            elif token.nesting == -1:
-                return i + 1
-
-            # Handle self-closing tags and content
-            else:
-                # Special handling for inline tokens
-                if token.type == "inline" and token.children:
-                    self._process_inline_tokens(token.children, parent)
-                else:
-                    node = self._create_node_from_token(token)
-                    if node:
-                        parent.add_child(node)
-
-            i += 1
-
-        return i
+    def _process_tokens(self, tokens: list[Token], parent: ASTNode) -> None:
+        """Process tokens and build the AST below a parent node.
 
-    def _process_inline_tokens(self, tokens: list[Token], parent: ASTNode) -> None:
-        """Process inline tokens with proper nesting.
+        Open tokens push their node onto an explicit stack of containers and
+        close tokens pop it, so nesting depth is not limited by the recursion
+        limit. The children of inline tokens are handled by the same loop,
+        and adjacent text they produce (text, line breaks, inline HTML) is
+        merged into one Text node per run.
 
         Args:
-            tokens: List of inline tokens
+            tokens: List of tokens to process, without hidden tokens
             parent: Parent node to add children to
         """
-        stack = []
-
-        for token in tokens:
-            if token.nesting == 1:
-                # Opening tag - create node and push to stack
-                node = self._create_node_from_token(token)
-                if node:
-                    if stack:
-                        stack[-1].add_child(node)
-                    else:
-                        parent.add_child(node)
-                    stack.append(node)
-            elif token.nesting == -1:
-                # Closing tag - pop from stack
-                if stack:
-                    stack.pop()
+        builders = self._token_builders
+        shared = self.share_text
+        stack = [parent]
+
+        for block_token in tokens:
+            if block_token.type == "inline":
+                inline_tokens = block_token.children or []
+                # Only the children this inline token adds get merged
+                inline_parent: ASTNode | None = stack[-1]
+                inline_start = len(stack[-1].children)
             else:
-                # Content or self-closing tag
-                node = self._create_node_from_token(token)
-                if node:
-                    if stack:
-                        stack[-1].add_child(node)
+                inline_tokens = [block_token]
+                inline_parent = None
+
+            for token in inline_tokens:
+                nesting = token.nesting
+
+                # Closing tags end the innermost container; never pop the root
+                if nesting == -1:
+                    if len(stack) > 1:
+                        closed = stack.pop()
+                        if inline_parent is not None:
+                            _merge_text_runs(closed, 0, shared)
+                    continue
+
+                builder = builders.get(token.type)
+                node = builder(token) if builder is not None else None
+                if nesting == 1:
+                    if node is None:
+                        # Structural wrapper (e.g. thead): its children belong
+                        # to the current container, pushed again to stay balanced
+                        stack.append(stack[-1])
                     else:
-                        parent.add_child(node)
+                        stack[-1].add_child(node)
+                        stack.append(node)
+                elif node is not None:
+                    stack[-1].add_child(node)
+
+            if inline_parent is not None:
+                _merge_text_runs(inline_parent, inline_start, shared)
 
     def _create_node_from_token(self, token: Token) -> ASTNode | None:
         """Create an AST node from a token.
@@ -253,80 +287,67 @@ class MarkdownItParser(Parser):
         Returns:
             AST node or None if token should be skipped
         """
-        # Content tokens
-        if token.type == "text":
-            return Text(content=token.content)
-        if token.type == "code_inline":
-            return InlineCode(content=token.content)
-        if token.type == "softbreak" or token.type == "hardbreak":
-            return Text(content="\n")
-        if token.type == "html_inline" or token.type == "html_block":
-            return Text(content=token.content)
-
-        # Block tokens
-        if token.type == "heading_open":
-            level = int(token.tag[1])  # h1 -> 1, h2 -> 2, etc.
-            node = Heading(level=level)
-            if token.attrGet("id"):
-                node.set_attr("id", token.attrGet("id"))
-            return node
-        if token.type == "paragraph_open":
-            return Paragraph()
-        if token.type == "blockquote_open":
-            return BlockQuote()
-        if token.type == "hr":
-            return HorizontalRule()
-        if token.type == "fence" or token.type == "code_block":
-            language = token.info.strip() if token.info else None
-            return CodeBlock(content=token.content, language=language)
-
-        # List tokens
-        if token.type == "bullet_list_open":
-            tight = getattr(token, "tight", True)
-            return List(ordered=False, tight=tight)
-        if token.type == "ordered_list_open":
-            start = token.attrGet("start")
-            tight = getattr(token, "tight", True)
-            return List(ordered=True, start=int(start) if start else 1, tight=tight)
-        if token.type == "list_item_open":
-            return ListItem()
-
-        # Inline tokens
-        if token.type == "em_open":
-            return Emphasis()
-        if token.type == "strong_open":
-            return Strong()
-        if token.type == "s_open":
-            # Create a generic strikethrough node
-            return ASTNode(type="strikethrough")
-        if token.type == "link_open":
-            href = token.attrGet("href") or ""
-            title = token.attrGet("title")
-            return Link(href=href, title=title)
-        if token.type == "image":
-            src = token.attrGet("src") or ""
-            alt = token.content
-            title = token.attrGet("title")
-            return Image(src=src, alt=alt, title=title)
-
-        # Table tokens
-        if token.type == "table_open":
-            return Table()
-        if token.type in ["thead_open", "tbody_open"]:
-            # These are structural tokens we can skip
-            return None
-        if token.type == "tr_open":
-            return TableRow()
-        if token.type in ["th_open", "td_open"]:
-            align = token.attrGet("style")
-            if align and "text-align:" in align:
-                align = align.split("text-align:")[1].split(";")[0].strip()
-            else:
-                align = None
-            return TableCell(header=(token.type == "th_open"), align=align)
-
-        # Skip closing tags and other tokens
-        return None
+        builder = self._token_builders.get(token.type)
+        return builder(token) if builder is not None else None
+
+    def _build_text(self, token: Token) -> ASTNode:
+        """Build a text node from a text token."""
+        return make_text(token.content, self.share_text)
+
+    def _build_break(self, token: Token) -> ASTNode:  # noqa: ARG002
+        """Build a newline text node from a soft or hard break."""
+        return make_text("\n", self.share_text)
+
+    def _build_heading(self, token: Token) -> Heading:
+        """Build a heading node, keeping an id set by a plugin."""
+        level = int(token.tag[1])  # h1 -> 1, h2 -> 2, etc.
+        node = Heading(level=level)
+        heading_id = token.attrGet("id")
+        if heading_id:
+            node.set_attr("id", heading_id)
+        return node
+
+    def _build_code_block(self, token: Token) -> CodeBlock:
+        """Build a code block from a fence or indented code token."""
+        language = token.info.strip() if token.info else None
+        return CodeBlock(content=token.content, language=language)
+
+    def _build_bullet_list(self, token: Token) -> List:
+        """Build an unordered list node."""
+        tight = getattr(token, "tight", True)
+        return List(ordered=False, tight=tight)
+
+    def _build_ordered_list(self, token: Token) -> List:
+        """Build an ordered list node."""
+        start = token.attrGet("start")
+        tight = getattr(token, "tight", True)
+        return List(ordered=True, start=int(start) if start else 1, tight=tight)
+
+    def _build_list_item(self, token: Token) -> ListItem:  # noqa: ARG002
+        """Build a list item node."""
+        return ListItem()
+
+    def _build_link(self, token: Token) -> Link:
+        """Build a link node."""
+        href = token.attrGet("href") or ""
+        title = token.attrGet("title")
+        return Link(href=href, title=title)
+
+    def _build_image(self, token: Token) -> Image:
+        """Build an image node."""
+        src = token.attrGet("src") or ""
+        alt = token.content
+        title = token.attrGet("title")
+        return Image(src=src, alt=alt, title=title)
+
+    def _build_table_cell(self, token: Token) -> TableCell:
+        """Build a header or body table cell with its alignment."""
+        align = token.attrGet("style")
+        if align and "text-align:" in align:
+            align = align.split("text-align:")[1].split(";")[0].strip()
+        else:
+            align = None
+        return TableCell(header=(token.type == "th_open"), align=align)
 
     def get_capabilities(self) -> dict[str, bool]:
         """Get parser capabilities.
@@ -334,18 +355,59 @@ class MarkdownItParser(Parser):
         Returns:
             Dictionary with capability flags
         """
-        return {
-            "tables": "table" in self.md.get_active_rules()["block"],
-            "strikethrough": "strikethrough" in self.md.get_active_rules()["inline"],
-            "task_lists": any("tasklist" in str(r) for r in self.md.get_active_rules()["inline"]),
-            "footnotes": any("footnote" in str(r) for r in self.md.get_active_rules()["block"]),
-            "definition_lists": any(
-                "deflist" in str(r) for r in self.md.get_active_rules()["block"]
-            ),
-            "math": False,  # Would need math plugin
-            "smart_quotes": self.md.options.get("typographer", False),
-            "custom_extensions": True,
-        }
+        if self._capabilities_cache is None:
+            rules = self.md.get_active_rules()
+            block_rules = rules["block"]
+            inline_rules = rules["inline"]
+            self._capabilities_cache = {
+                "tables": "table" in block_rules,
+                "strikethrough": "strikethrough" in inline_rules,
+                "task_lists": any("tasklist" in r for r in inline_rules),
+                "footnotes": any("footnote" in r for r in block_rules),
+                "definition_lists": any("deflist" in r for r in block_rules),
+                "math": False,  # Would need math plugin
+                "smart_quotes": self.md.options.get("typographer", False),
+                "custom_extensions": True,
+            }
+        return dict(self._capabilities_cache)
+
+
+def _merge_text_runs(node: ASTNode, start: int, shared: bool) -> None:
+    """Merge runs of adjacent Text children into single Text nodes.
+
+    Renderers then escape and emit each run once instead of once per piece.
+
+    Args:
+        node: Node whose children to merge
+        start: Index of the first child to consider
+        shared: Create merged nodes with ``make_text(shared=True)``
+    """
+    children = node.children
+    if len(children) <= start + 1:
+        return
+
+    merged = children[:start]
+    run: list[ASTNode] = []
+    for child in children[start:]:
+        if child.type == TYPE_TEXT:
+            run.append(child)
+            continue
+        if run:
+            merged.append(_join_text_run(run, shared))
+            run = []
+        merged.append(child)
+    if run:
+        merged.append(_join_text_run(run, shared))
+
+    if len(merged) != len(children):
+        node.children = merged
+
+
+def _join_text_run(run: list[ASTNode], shared: bool) -> ASTNode:
+    """Return one Text node for a run of Text nodes."""
+    if len(run) == 1:
+        return run[0]
+    return make_text("".join(text.content or "" for text in run), shared)
 
 
 # Register the parser
@@ -3,7 +3,9 @@
 
 from __future__ import annotations
 
-from typing import Any
+import sys
+from collections.abc import Callable
+from typing import Any, Final, cast
 
 import mistletoe
 from loguru import logger
@@ -76,10 +78,17 @@ from marktripy.core.ast import (
     Table,
     TableCell,
     TableRow,
-    Text,
+    make_text,
 )
 from marktripy.core.parser import Parser, ParserError, ParserRegistry
 
+# Raw text shorter than this is interned, so repeated words, punctuation and
+# table cell values share one string object across the AST
+_INTERN_MAX_LEN = 64
+
+# Token converter; None in a dispatch dict caches an unsupported token class
+_Converter = Callable[[Any], ASTNode | None]
+
 
 class MistletoeParser(Parser):
     """Parser adapter for mistletoe.
@@ -95,6 +104,28 @@ class MistletoeParser(Parser):
             config: Parser configuration
         """
         super().__init__(config)
+
+        # Converters keyed by exact token class; subclasses are resolved
+        # once through isinstance and then cached under their own class
+        self._block_dispatch: Final[dict[type, _Converter | None]] = {
+            MistletoeHeading: self._convert_heading,
+            SetextHeading: self._convert_setext_heading,
+            MistletoeParagraph: self._convert_paragraph,
+            MistletoeList: self._convert_list,
+            MistletoeListItem: self._convert_list_item,
+            BlockCode: self._convert_code_block,
+            MistletoeQuote: self._convert_quote,
+            ThematicBreak: self._convert_thematic_break,
+            MistletoeTable: self._convert_table,
+        }
+        self._span_dispatch: Final[dict[type, _Converter | None]] = {
+            RawText: self._convert_raw_text,
+            MistletoeEmphasis: self._convert_emphasis,
+            MistletoeStrong: self._convert_strong,
+            MistletoeCode: self._convert_inline_code,
+            MistletoeLink: self._convert_link,
+            MistletoeImage: self._convert_image,
+        }
         logger.info("Initialized MistletoeParser")
 
     def parse(self, text: str) -> Document:
@@ -109,25 +140,37 @@ class MistletoeParser(Parser):
         Raises:
             ParserError: If parsing fails
         """
+        cached = self._cache_lookup(text)
+        if cached is not None:
+            return cached
+
         try:
             # Preprocess text
-            text = self.preprocess(text)
+            source = self.preprocess(text)
 
             # Parse with mistletoe
-            mistletoe_doc = mistletoe.Document(text)
+            mistletoe_doc = mistletoe.Document(source)
 
             # Convert to our AST
             doc = self._convert_document(mistletoe_doc)
 
             # Postprocess
-            return self.postprocess(doc)
+            doc = self.postprocess(doc)
 
         except Exception as e:
             raise ParserError(f"Failed to parse Markdown: {e}") from e
 
+        self._cache_store(text, doc)
+        return doc
+
     def _convert_document(self, mistletoe_doc: MistletoeDocument) -> Document:
         """Convert mistletoe document to our AST.
 
+        Block tokens are converted from an explicit work stack of
+        (parent node, token) pairs rather than by recursing once per
+        nesting level. Container converters return empty nodes; their child
+        tokens are pushed onto the stack here.
+
         Args:
             mistletoe_doc: Mistletoe document
 
@@ -136,10 +179,30 @@ class MistletoeParser(Parser):
         """
         doc = Document()
 
-        for child in mistletoe_doc.children:
-            node = self._convert_block_token(child)
-            if node:
-                doc.add_child(node)
+        # Container tokens keep their children in a list, though mistletoe
+        # types them as an optional iterable
+        stack: list[tuple[ASTNode, Any]] = [
+            (doc, child) for child in reversed(cast("list[Any]", mistletoe_doc.children))
+        ]
+        while stack:
+            parent, token = stack.pop()
+
+            if not isinstance(token, BlockToken):
+                # Inline content directly inside a container (e.g. a list item)
+                self._add_inline_content(parent, [token])
+                continue
+
+            node = self._convert_block_token(token)
+            if node is None:
+                continue
+            parent.add_child(node)
+
+            if isinstance(node, (List, ListItem, BlockQuote)):
+                children = cast("list[Any]", token.children)
+                if isinstance(node, List):
+                    children = [child for child in children if isinstance(child, MistletoeListItem)]
+                # Reversed so children are converted in document order
+                stack.extend((node, child) for child in reversed(children))
 
         return doc
 
@@ -152,26 +215,39 @@ class MistletoeParser(Parser):
         Returns:
             Converted AST node, or None if not supported
         """
-        if isinstance(token, MistletoeHeading):
-            return self._convert_heading(token)
-        if isinstance(token, SetextHeading):
-            return self._convert_setext_heading(token)
-        if isinstance(token, MistletoeParagraph):
-            return self._convert_paragraph(token)
-        if isinstance(token, MistletoeList):
-            return self._convert_list(token)
-        if isinstance(token, MistletoeListItem):
-            return self._convert_list_item(token)
-        if isinstance(token, BlockCode):
-            return self._convert_code_block(token)
-        if isinstance(token, MistletoeQuote):
-            return self._convert_quote(token)
-        if isinstance(token, ThematicBreak):
-            return HorizontalRule()
-        if isinstance(token, MistletoeTable):
-            return self._convert_table(token)
-        logger.warning(f"Unsupported block token type: {type(token).__name__}")
-        return None
+        handler = self._find_handler(self._block_dispatch, token)
+        if handler is None:
+            logger.warning("Unsupported block token type: {}", type(token).__name__)
+            return None
+        return handler(token)
+
+    @staticmethod
+    def _find_handler(dispatch: dict[type, _Converter | None], token: Any) -> _Converter | None:
+        """Look up the converter for a token.
+
+        Exact token classes hit the dispatch dict directly. Other classes are
+        matched with isinstance in registration order, and the result (even
+        a miss) is cached under the token's class.
+
+        Args:
+            dispatch: Mapping of token class to converter
+            token: Mistletoe token
+
+        Returns:
+            Converter callable, or None if the token type is not supported
+        """
+        token_class = type(token)
+        try:
+            return dispatch[token_class]
+        except KeyError:
+            pass
+        handler = None
+        for cls, candidate in dispatch.items():
+            if candidate is not None and isinstance(token, cls):
+                handler = candidate
+                break
+        dispatch[token_class] = handler
+        return handler
 
     def _convert_heading(self, token: MistletoeHeading) -> Heading:
         """Convert mistletoe heading to our heading."""
@@ -194,89 +270,70 @@ class MistletoeParser(Parser):
         return para
 
     def _convert_list(self, token: MistletoeList) -> List:
-        """Convert mistletoe list to our list."""
+        """Convert mistletoe list to our list (items are added by the caller)."""
         # Determine if ordered
-        ordered = hasattr(token, "start") and token.start is not None
-        start = getattr(token, "start", None) if ordered else None
-        tight = getattr(token, "tight", True)
-
-        list_node = List(ordered=ordered, start=start, tight=tight)
-
-        for child in token.children:
-            if isinstance(child, MistletoeListItem):
-                item = self._convert_list_item(child)
-                if item:
-                    list_node.add_child(item)
-
-        return list_node
-
-    def _convert_list_item(self, token: MistletoeListItem) -> ListItem:
-        """Convert mistletoe list item to our list item."""
-        item = ListItem()
+        # mistletoe always sets start (None for bullet lists) and loose. The
+        # instance attribute shadows the List.start() classmethod, which is
+        # what mypy sees
+        start = cast("int | None", token.start)
+        return List(ordered=start is not None, start=start, tight=not token.loose)
 
-        for child in token.children:
-            if isinstance(child, BlockToken):
-                node = self._convert_block_token(child)
-                if node:
-                    item.add_child(node)
-            else:
-                # Inline content
-                self._add_inline_content(item, [child])
-
-        return item
+    def _convert_list_item(self, token: MistletoeListItem) -> ListItem:  # noqa: ARG002
+        """Convert mistletoe list item to our list item (content is added by the caller)."""
+        return ListItem()
 
     def _convert_code_block(self, token: BlockCode) -> CodeBlock:
         """Convert mistletoe code block to our code block."""
-        language = getattr(token, "language", None) or None
+        language = token.language or None
         content = token.children[0].content if token.children else ""
         return CodeBlock(content=content, language=language)
 
-    def _convert_quote(self, token: MistletoeQuote) -> BlockQuote:
-        """Convert mistletoe quote to our blockquote."""
-        quote = BlockQuote()
-
-        for child in token.children:
-            node = self._convert_block_token(child)
-            if node:
-                quote.add_child(node)
+    def _convert_thematic_break(self, token: ThematicBreak) -> HorizontalRule:  # noqa: ARG002
+        """Convert mistletoe thematic break to our horizontal rule."""
+        return HorizontalRule()
 
-        return quote
+    def _convert_quote(self, token: MistletoeQuote) -> BlockQuote:  # noqa: ARG002
+        """Convert mistletoe quote to our blockquote (content is added by the caller)."""
+        return BlockQuote()
 
     def _convert_table(self, token: MistletoeTable) -> Table:
         """Convert mistletoe table to our table."""
         table = Table()
 
         # Process header if present
-        if hasattr(token, "header") and token.header:
+        # Tables without a delimiter row have no header attribute at all
+        header = getattr(token, "header", None)
+        if header is not None:
             header_row = TableRow()
-            for cell in token.header.children:
-                if isinstance(cell, MistletoeTableCell):
-                    cell_node = self._convert_table_cell(cell, header=True)
-                    header_row.add_child(cell_node)
+            header_row.add_children(
+                self._convert_table_cell(cell, header=True)
+                for cell in header.children
+                if isinstance(cell, MistletoeTableCell)
+            )
             table.add_child(header_row)
 
         # Process body rows
-        for row in token.children:
-            if isinstance(row, MistletoeTableRow):
-                row_node = self._convert_table_row(row)
-                table.add_child(row_node)
+        table.add_children(
+            self._convert_table_row(row)
+            for row in token.children
+            if isinstance(row, MistletoeTableRow)
+        )
 
         return table
 
     def _convert_table_row(self, token: MistletoeTableRow) -> TableRow:
         """Convert mistletoe table row to our table row."""
         row = TableRow()
-
-        for cell in token.children:
-            if isinstance(cell, MistletoeTableCell):
-                cell_node = self._convert_table_cell(cell)
-                row.add_child(cell_node)
-
+        row.add_children(
+            self._convert_table_cell(cell)
+            for cell in token.children
+            if isinstance(cell, MistletoeTableCell)
+        )
         return row
 
     def _convert_table_cell(self, token: MistletoeTableCell, header: bool = False) -> TableCell:
         """Convert mistletoe table cell to our table cell."""
-        align = getattr(token, "align", None)
+        align = token.align
         cell = TableCell(header=header, align=align)
         self._add_inline_content(cell, token.children)
         return cell
@@ -288,10 +345,9 @@ class MistletoeParser(Parser):
             parent: Parent node to add content to
             tokens: List of mistletoe span tokens
         """
-        for token in tokens:
-            node = self._convert_span_token(token)
-            if node:
-                parent.add_child(node)
+        convert = self._convert_span_token
+        nodes = [convert(token) for token in tokens]
+        parent.add_children(node for node in nodes if node is not None)
 
     def _convert_span_token(self, token: SpanToken) -> ASTNode | None:
         """Convert a mistletoe span token to our AST node.
@@ -302,30 +358,48 @@ class MistletoeParser(Parser):
         Returns:
             Converted AST node, or None if not supported
         """
-        if isinstance(token, RawText):
-            return Text(content=token.content)
-        if isinstance(token, MistletoeEmphasis):
-            em = Emphasis()
-            self._add_inline_content(em, token.children)
-            return em
-        if isinstance(token, MistletoeStrong):
-            strong = Strong()
-            self._add_inline_content(strong, token.children)
-            return strong
-        if isinstance(token, MistletoeCode):
-            return InlineCode(content=token.children[0].content)
-        if isinstance(token, MistletoeLink):
-            link = Link(href=token.target, title=getattr(token, "title", None))
-            self._add_inline_content(link, token.children)
-            return link
-        if isinstance(token, MistletoeImage):
-            return Image(
-                src=token.target,
-                alt=token.children[0].content if token.children else "",
-                title=getattr(token, "title", None),
-            )
-        logger.warning(f"Unsupported span token type: {type(token).__name__}")
-        return None
+        handler = self._find_handler(self._span_dispatch, token)
+        if handler is None:
+            logger.warning("Unsupported span token type: {}", type(token).__name__)
+            return None
+        return handler(token)
+
+    def _convert_raw_text(self, token: RawText) -> ASTNode:
+        """Convert mistletoe raw text to our text."""
+        content = token.content
+        if len(content) < _INTERN_MAX_LEN:
+            content = sys.intern(content)
+        return make_text(content)
+
+    def _convert_emphasis(self, token: MistletoeEmphasis) -> Emphasis:
+        """Convert mistletoe emphasis to our emphasis."""
+        em = Emphasis()
+        self._add_inline_content(em, token.children)
+        return em
+
+    def _convert_strong(self, token: MistletoeStrong) -> Strong:
+        """Convert mistletoe strong to our strong."""
+        strong = Strong()
+        self._add_inline_content(strong, token.children)
+        return strong
+
+    def _convert_inline_code(self, token: MistletoeCode) -> InlineCode:
+        """Convert mistletoe inline code to our inline code."""
+        return InlineCode(content=token.children[0].content)
+
+    def _convert_link(self, token: MistletoeLink) -> Link:
+        """Convert mistletoe link to our link."""
+        link = Link(href=token.target, title=token.title)
+        self._add_inline_content(link, token.children)
+        return link
+
+    def _convert_image(self, token: MistletoeImage) -> Image:
+        """Convert mistletoe image to our image."""
+        return Image(
+            src=token.src,
+            alt=token.children[0].content if token.children else "",
+            title=token.title,
+        )
 
     def get_capabilities(self) -> dict[str, bool]:
         """Get parser capabilities.
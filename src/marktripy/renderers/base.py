@@ -4,11 +4,22 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from typing import Any
 
 from loguru import logger
 
-from marktripy.core.ast import ASTNode, Document
+from marktripy.core.ast import _DEBUG, ASTNode, Document
+
+# Translation table for escaping HTML text content (&, <, >) in a single pass
+HTML_ESCAPE_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+
+# render_* methods that are entry points rather than per-type renderers
+_NOT_NODE_RENDERERS = frozenset({"render_node", "render_children", "render_unknown"})
+
+# Node types with a render_<type> method, per renderer class; dir() is too
+# slow to run for every renderer instance
+_RENDERED_TYPES: dict[type, tuple[str, ...]] = {}
 
 
 class Renderer(ABC):
@@ -25,7 +36,28 @@ class Renderer(ABC):
             config: Renderer-specific configuration options
         """
         self.config = config or {}
-        logger.debug(f"Initialized {self.__class__.__name__} with config: {self.config}")
+
+        # Render method per node type, so dispatch needs no string formatting
+        # or attribute lookup; __setattr__ keeps it in sync when extensions
+        # install render_<type> methods on the instance
+        cls = type(self)
+        node_types = _RENDERED_TYPES.get(cls)
+        if node_types is None:
+            node_types = _RENDERED_TYPES[cls] = tuple(
+                name[7:]
+                for name in dir(cls)
+                if name.startswith("render_") and name not in _NOT_NODE_RENDERERS
+            )
+        self._dispatch: dict[str, Callable[[Any], str | None]] = {
+            node_type: getattr(self, "render_" + node_type) for node_type in node_types
+        }
+        logger.debug("Initialized {} with config: {}", self.__class__.__name__, self.config)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute, registering ``render_<type>`` methods for dispatch."""
+        super().__setattr__(name, value)
+        if name.startswith("render_") and name not in _NOT_NODE_RENDERERS:
+            self._dispatch[name[7:]] = value
 
     @abstractmethod
     def render(self, ast: Document) -> str:
@@ -116,32 +148,38 @@ class RenderContext:
         """Enter a list context."""
         self.list_depth += 1
         self.tight_list = tight
-        logger.debug(f"Entered list, depth={self.list_depth}, tight={tight}")
+        if _DEBUG:
+            logger.debug(f"Entered list, depth={self.list_depth}, tight={tight}")
 
     def exit_list(self) -> None:
         """Exit a list context."""
         self.list_depth = max(0, self.list_depth - 1)
-        logger.debug(f"Exited list, depth={self.list_depth}")
+        if _DEBUG:
+            logger.debug(f"Exited list, depth={self.list_depth}")
 
     def enter_table(self) -> None:
         """Enter a table context."""
         self.in_table = True
-        logger.debug("Entered table")
+        if _DEBUG:
+            logger.debug("Entered table")
 
     def exit_table(self) -> None:
         """Exit a table context."""
         self.in_table = False
-        logger.debug("Exited table")
+        if _DEBUG:
+            logger.debug("Exited table")
 
     def enter_code_block(self) -> None:
         """Enter a code block context."""
         self.in_code_block = True
-        logger.debug("Entered code block")
+        if _DEBUG:
+            logger.debug("Entered code block")
 
     def exit_code_block(self) -> None:
         """Exit a code block context."""
         self.in_code_block = False
-        logger.debug("Exited code block")
+        if _DEBUG:
+            logger.debug("Exited code block")
 
     def set_data(self, key: str, value: Any) -> None:
         """Store custom data in the context."""
@@ -169,7 +207,7 @@ class RendererRegistry:
             raise TypeError(f"{renderer_class} must be a subclass of Renderer")
 
         cls._renderers[name] = renderer_class
-        logger.info(f"Registered renderer: {name} -> {renderer_class.__name__}")
+        logger.info("Registered renderer: {} -> {}", name, renderer_class.__name__)
 
     @classmethod
     def get(cls, name: str) -> type[Renderer]:
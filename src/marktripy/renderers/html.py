@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import html
+from collections.abc import Callable
 from typing import Any
 
 from loguru import logger
@@ -30,9 +31,24 @@ from marktripy.core.ast import (
 )
 from marktripy.renderers.base import RenderContext, Renderer, RendererRegistry
 
+# Upper bound on memoized single-attribute strings per renderer
+_ATTR_CACHE_SIZE = 512
+
+# Node attributes that links and images render from their fields, by whether
+# the node has a title
+_LINK_FIELD_ATTRS = {False: frozenset({"href"}), True: frozenset({"href", "title"})}
+_IMAGE_FIELD_ATTRS = {False: frozenset({"src", "alt"}), True: frozenset({"src", "alt", "title"})}
+
 
 class HTMLRenderer(Renderer):
-    """Renderer that converts AST to HTML."""
+    """Renderer that converts AST to HTML.
+
+    Output is written to a single list of string parts that is joined once
+    at the end, so child HTML is never re-copied into each enclosing
+    element's string. A ``render_<type>`` method either appends to
+    ``self._buf`` and returns None, or returns its HTML as a string (as
+    extension renderers do), which is then appended for it.
+    """
 
     def __init__(self, config: dict[str, Any] | None = None):
         """Initialize HTML renderer.
@@ -56,6 +72,23 @@ class HTMLRenderer(Renderer):
         self.quotes = self.config.get("quotes", '""' + "''")
 
         self.context = RenderContext()
+        self._buf: list[str] = []
+        self._attr_cache: dict[tuple[str, str], str] = {}
+
+        # List item renderers keyed by whether the item is a task; extensions
+        # such as TaskListExtension replace the True entry
+        self._list_item_renderers: dict[bool, Callable[[ListItem], str | None]] = {
+            False: self._render_plain_list_item,
+            True: self._render_plain_list_item,
+        }
+
+        # Child nodes are written with _emit_child. A subclass that overrides
+        # render_node() gets every node passed to it, as the public hook
+        self._emit_child: Callable[[ASTNode], None] = (
+            self._emit
+            if type(self).render_node is HTMLRenderer.render_node
+            else self._emit_via_render_node
+        )
         logger.info("Initialized HTMLRenderer")
 
     def render(self, ast: Document) -> str:
@@ -68,7 +101,9 @@ class HTMLRenderer(Renderer):
             The rendered HTML
         """
         self.context = RenderContext()
-        return self.render_node(ast)
+        self._buf = []
+        self._emit_child(ast)
+        return "".join(self._buf)
 
     def render_node(self, node: ASTNode) -> str:
         """Render a single AST node.
@@ -79,9 +114,66 @@ class HTMLRenderer(Renderer):
         Returns:
             The rendered HTML
         """
-        method_name = f"render_{node.type}"
-        render_method = getattr(self, method_name, self.render_unknown)
-        return render_method(node)
+        buf = self._buf
+        mark = len(buf)
+        self._emit(node)
+        rendered = "".join(buf[mark:])
+        del buf[mark:]
+        return rendered
+
+    def render_children(self, node: ASTNode) -> str:
+        """Render all children of a node.
+
+        Args:
+            node: The parent node
+
+        Returns:
+            Concatenated HTML of all children
+        """
+        buf = self._buf
+        mark = len(buf)
+        self._emit_children(node)
+        rendered = "".join(buf[mark:])
+        del buf[mark:]
+        return rendered
+
+    def _emit(self, node: ASTNode) -> None:
+        """Write the HTML for a node to the output buffer.
+
+        Args:
+            node: The node to render
+        """
+        # Unknown types are rare, so look up first and handle the miss.
+        # Only the lookup is guarded: a KeyError raised while rendering
+        # must not be taken for an unknown node type
+        try:
+            render_method = self._dispatch[node.type]
+        except KeyError:
+            # Covers methods added to the class after this instance was made
+            render_method = getattr(self, f"render_{node.type}", self.render_unknown)
+        rendered = render_method(node)
+        if rendered:
+            self._buf.append(rendered)
+
+    def _emit_via_render_node(self, node: ASTNode) -> None:
+        """Write the HTML for a node returned by an overridden ``render_node``.
+
+        Args:
+            node: The node to render
+        """
+        rendered = self.render_node(node)
+        if rendered:
+            self._buf.append(rendered)
+
+    def _emit_children(self, node: ASTNode) -> None:
+        """Write the HTML for all children of a node to the output buffer.
+
+        Args:
+            node: The parent node
+        """
+        emit = self._emit_child
+        for child in node.children:
+            emit(child)
 
     def render_unknown(self, node: ASTNode) -> str:
         """Render unknown node types.
@@ -92,7 +184,7 @@ class HTMLRenderer(Renderer):
         Returns:
             HTML comment with node info
         """
-        logger.warning(f"Unknown node type: {node.type}")
+        logger.warning("Unknown node type: {}", node.type)
         return f"<!-- Unknown node type: {node.type} -->"
 
     def escape(self, text: str) -> str:
@@ -102,36 +194,51 @@ class HTMLRenderer(Renderer):
             text: Raw text to escape
 
         Returns:
-            HTML-escaped text
+            HTML-escaped text; the input itself when nothing needs escaping
         """
-        return html.escape(text, quote=True)
+        # Most text has no special characters; each substring test is a C
+        # memchr scan, far cheaper than html.escape's five copying replaces
+        if "&" in text or "<" in text or ">" in text or '"' in text or "'" in text:
+            return html.escape(text, quote=True)
+        return text
 
     # Document and structure nodes
 
-    def render_document(self, node: Document) -> str:
+    def render_document(self, node: Document) -> None:
         """Render document node."""
-        return self.render_children(node)
+        self._emit_children(node)
 
-    def render_heading(self, node: Heading) -> str:
+    def render_heading(self, node: Heading) -> None:
         """Render heading node."""
         level = node.level
-        content = self.render_children(node)
-        attrs = self._render_attrs(node.attrs)
-        return f"<h{level}{attrs}>{content}</h{level}>\n"
+        buf = self._buf
+        buf.append(f"<h{level}{self._render_attrs(node.attrs)}>")
+        self._emit_children(node)
+        buf.append(f"</h{level}>\n")
 
-    def render_paragraph(self, node: Paragraph) -> str:
+    def render_paragraph(self, node: Paragraph) -> None:
         """Render paragraph node."""
-        content = self.render_children(node)
-        if not content.strip():
-            return ""
-        attrs = self._render_attrs(node.attrs)
-        return f"<p{attrs}>{content}</p>\n"
+        buf = self._buf
+        mark = len(buf)
+        buf.append("")  # Opening tag, filled in once the content is known
+        self._emit_children(node)
+
+        # Drop paragraphs with only whitespace content
+        if not any(part and not part.isspace() for part in buf[mark + 1 :]):
+            del buf[mark:]
+            return
 
-    def render_blockquote(self, node: BlockQuote) -> str:
+        buf[mark] = f"<p{self._render_attrs(node.attrs)}>" if node.attrs else "<p>"
+        buf.append("</p>\n")
+
+    def render_blockquote(self, node: BlockQuote) -> None:
         """Render blockquote node."""
-        content = self.render_children(node)
-        attrs = self._render_attrs(node.attrs)
-        return f"<blockquote{attrs}>\n{content}</blockquote>\n"
+        buf = self._buf
+        buf.append(
+            f"<blockquote{self._render_attrs(node.attrs)}>\n" if node.attrs else "<blockquote>\n"
+        )
+        self._emit_children(node)
+        buf.append("</blockquote>\n")
 
     def render_horizontal_rule(self, node: HorizontalRule) -> str:
         """Render horizontal rule node."""
@@ -157,62 +264,75 @@ class HTMLRenderer(Renderer):
 
         return text
 
-    def render_emphasis(self, node: Emphasis) -> str:
+    def render_emphasis(self, node: Emphasis) -> None:
         """Render emphasis (italic) node."""
-        content = self.render_children(node)
-        attrs = self._render_attrs(node.attrs)
-        return f"<em{attrs}>{content}</em>"
+        buf = self._buf
+        buf.append(f"<em{self._render_attrs(node.attrs)}>" if node.attrs else "<em>")
+        self._emit_children(node)
+        buf.append("</em>")
 
-    def render_strong(self, node: Strong) -> str:
+    def render_strong(self, node: Strong) -> None:
         """Render strong (bold) node."""
-        content = self.render_children(node)
-        attrs = self._render_attrs(node.attrs)
-        return f"<strong{attrs}>{content}</strong>"
+        buf = self._buf
+        buf.append(f"<strong{self._render_attrs(node.attrs)}>" if node.attrs else "<strong>")
+        self._emit_children(node)
+        buf.append("</strong>")
 
     # Code nodes
 
     def render_code_block(self, node: CodeBlock) -> str:
         """Render code block node."""
         code = self.escape(node.content or "")
-        attrs = node.attrs.copy()
-
-        # Add language class if specified
-        if node.language:
-            lang_class = f"{self.lang_prefix}{node.language}"
-            if "class" in attrs:
-                attrs["class"] += f" {lang_class}"
-            else:
-                attrs["class"] = lang_class
+        attrs = node.attrs
+
+        # Add language class if specified; the attrs dict is only copied
+        # when it already has a class to extend
+        if not node.language:
+            attrs_str = self._render_attrs(attrs)
+        elif attrs and "class" in attrs:
+            attrs = {**attrs, "class": f"{attrs['class']} {self.lang_prefix}{node.language}"}
+            attrs_str = self._render_attrs(attrs)
+        else:
+            lang_class = self.escape(f"{self.lang_prefix}{node.language}")
+            attrs_str = f'{self._render_attrs(attrs)} class="{lang_class}"'
 
-        attrs_str = self._render_attrs(attrs)
         return f"<pre><code{attrs_str}>{code}</code></pre>\n"
 
     def render_inline_code(self, node: InlineCode) -> str:
         """Render inline code node."""
         code = self.escape(node.content or "")
-        attrs = self._render_attrs(node.attrs)
-        return f"<code{attrs}>{code}</code>"
+        if not node.attrs:
+            return f"<code>{code}</code>"
+        return f"<code{self._render_attrs(node.attrs)}>{code}</code>"
 
     # Link and image nodes
 
-    def render_link(self, node: Link) -> str:
+    def render_link(self, node: Link) -> None:
         """Render link node."""
-        content = self.render_children(node)
-        attrs = node.attrs.copy()
-        attrs["href"] = self.escape(node.href)
-        if node.title:
-            attrs["title"] = self.escape(node.title)
-        attrs_str = self._render_attrs(attrs)
-        return f"<a{attrs_str}>{content}</a>"
+        # href and title come from the fields and override the node
+        # attributes of the same name
+        title = node.title
+        attrs_str = f' href="{self.escape(node.href)}"'
+        if title:
+            attrs_str += f' title="{self.escape(title)}"'
+        if node.attrs:
+            attrs_str += self._render_attrs_except(node.attrs, _LINK_FIELD_ATTRS[bool(title)])
+        buf = self._buf
+        buf.append(f"<a{attrs_str}>")
+        self._emit_children(node)
+        buf.append("</a>")
 
     def render_image(self, node: Image) -> str:
         """Render image node."""
-        attrs = node.attrs.copy()
-        attrs["src"] = self.escape(node.src)
-        attrs["alt"] = self.escape(node.alt)
-        if node.title:
-            attrs["title"] = self.escape(node.title)
-        attrs_str = self._render_attrs(attrs)
+        # src, alt and title come from the fields and override the node
+        # attributes of the same name
+        escape = self.escape
+        title = node.title
+        attrs_str = f' src="{escape(node.src)}" alt="{escape(node.alt)}"'
+        if title:
+            attrs_str += f' title="{escape(title)}"'
+        if node.attrs:
+            attrs_str += self._render_attrs_except(node.attrs, _IMAGE_FIELD_ATTRS[bool(title)])
 
         if self.xhtml:
             return f"<img{attrs_str} />"
@@ -220,7 +340,7 @@ class HTMLRenderer(Renderer):
 
     # List nodes
 
-    def render_list(self, node: List) -> str:
+    def render_list(self, node: List) -> None:
         """Render list node."""
         self.context.enter_list(node.tight)
 
@@ -230,79 +350,136 @@ class HTMLRenderer(Renderer):
             attrs["start"] = str(node.start)
 
         # Merge with node attributes
-        attrs.update(node.attrs)
-        attrs_str = self._render_attrs(attrs)
-        content = self.render_children(node)
+        if node.attrs:
+            attrs.update(node.attrs)
+        buf = self._buf
+        buf.append(f"<{tag}{self._render_attrs(attrs)}>\n")
+        self._emit_children(node)
 
         self.context.exit_list()
-        return f"<{tag}{attrs_str}>\n{content}</{tag}>\n"
+        buf.append(f"</{tag}>\n")
 
-    def render_list_item(self, node: ListItem) -> str:
+    def render_list_item(self, node: ListItem) -> str | None:
         """Render list item node."""
-        content = self.render_children(node)
-        attrs = self._render_attrs(node.attrs)
+        return self._list_item_renderers[bool(node.get_attr("task"))](node)
+
+    def _render_plain_list_item(self, node: ListItem) -> None:
+        """Render a list item without extension handling."""
+        buf = self._buf
+        buf.append(f"<li{self._render_attrs(node.attrs)}>" if node.attrs else "<li>")
+        mark = len(buf)
+        self._emit_children(node)
 
         # In tight lists, strip paragraph tags
         if self.context.tight_list:
-            content = content.strip()
+            self._strip_tight_content(mark)
+
+        buf.append("</li>\n")
+
+    def _strip_tight_content(self, mark: int) -> None:
+        """Strip a tight list item's content in the output buffer.
+
+        Has the effect of ``content.strip()`` followed by removing a
+        surrounding ``<p>``/``</p>`` pair on the joined ``self._buf[mark:]``,
+        but only touches the first and last non-blank parts instead of
+        joining and rescanning the item's HTML.
+
+        Args:
+            mark: Buffer index where the item's content starts
+        """
+        buf = self._buf
+        first = mark
+        last = len(buf) - 1
+
+        # Strip leading whitespace, dropping parts that are only whitespace
+        while first <= last:
+            buf[first] = buf[first].lstrip()
+            if buf[first]:
+                break
+            first += 1
+        else:
+            return
+
+        # Strip trailing whitespace; buf[first] is non-blank, so this stops
+        while True:
+            buf[last] = buf[last].rstrip()
+            if buf[last]:
+                break
+            last -= 1
+
+        head = buf[first]
+        tail = buf[last]
+        if first == last or len(head) < len("<p>") or len(tail) < len("</p>"):
+            # The tags could straddle parts; check the joined content
+            content = "".join(buf[first : last + 1])
             if content.startswith("<p>") and content.endswith("</p>"):
                 content = content[3:-4]
-
-        return f"<li{attrs}>{content}</li>\n"
+            buf[first:] = [content]
+        elif head.startswith("<p>") and tail.endswith("</p>"):
+            buf[first] = head[3:]
+            buf[last] = tail[:-4]
 
     # Table nodes
 
-    def render_table(self, node: Table) -> str:
+    def render_table(self, node: Table) -> None:
         """Render table node."""
         self.context.enter_table()
 
         attrs = self._render_attrs(node.attrs)
 
-        # Separate header and body rows
-        header_rows = []
-        body_rows = []
-        in_header = True
+        # Separate header and body rows: leading all-header rows form the
+        # header, and everything from the first other row is body
+        header_rows: list[TableRow] = []
+        body_rows: list[TableRow] = []
+        rows = (child for child in node.children if isinstance(child, TableRow))
+
+        for row in rows:
+            # Plain loop with an exact type check; all() over a generator
+            # with isinstance() costs several times more per cell
+            for cell in row.children:
+                if type(cell) is not TableCell or not cell.header:
+                    break
+            else:
+                header_rows.append(row)
+                continue
+            body_rows.append(row)
+            body_rows.extend(rows)
+            break
 
-        for child in node.children:
-            if isinstance(child, TableRow):
-                if in_header and all(
-                    isinstance(cell, TableCell) and cell.header for cell in child.children
-                ):
-                    header_rows.append(child)
-                else:
-                    in_header = False
-                    body_rows.append(child)
-
-        # Build table HTML
-        html_parts = [f"<table{attrs}>"]
+        # Write table HTML, one line per section tag and row
+        buf = self._buf
+        emit = self._emit_child
+        buf.append(f"<table{attrs}>")
 
         if header_rows:
-            html_parts.append("<thead>")
+            buf.append("\n<thead>")
             for row in header_rows:
-                html_parts.append(self.render_node(row))
-            html_parts.append("</thead>")
+                buf.append("\n")
+                emit(row)
+            buf.append("\n</thead>")
 
         if body_rows:
-            html_parts.append("<tbody>")
+            buf.append("\n<tbody>")
             for row in body_rows:
-                html_parts.append(self.render_node(row))
-            html_parts.append("</tbody>")
+                buf.append("\n")
+                emit(row)
+            buf.append("\n</tbody>")
 
-        html_parts.append("</table>\n")
+        buf.append("\n</table>\n")
 
         self.context.exit_table()
-        return "\n".join(html_parts)
 
-    def render_table_row(self, node: TableRow) -> str:
+    def render_table_row(self, node: TableRow) -> None:
         """Render table row node."""
-        content = self.render_children(node)
-        attrs = self._render_attrs(node.attrs)
-        return f"<tr{attrs}>\n{content}</tr>"
+        buf = self._buf
+        buf.append(f"<tr{self._render_attrs(node.attrs)}>\n" if node.attrs else "<tr>\n")
+        self._emit_children(node)
+        buf.append("</tr>")
 
-    def render_table_cell(self, node: TableCell) -> str:
+    def render_table_cell(self, node: TableCell) -> None:
         """Render table cell node."""
         tag = "th" if node.header else "td"
-        attrs = node.attrs.copy()
+        attrs = node.attrs.copy() if node.attrs else {}
 
         if node.align:
             style = attrs.get("style", "")
@@ -311,17 +488,18 @@ class HTMLRenderer(Renderer):
             style += f"text-align: {node.align};"
             attrs["style"] = style
 
-        attrs_str = self._render_attrs(attrs)
-        content = self.render_children(node)
-        return f"<{tag}{attrs_str}>{content}</{tag}>\n"
+        buf = self._buf
+        buf.append(f"<{tag}{self._render_attrs(attrs)}>")
+        self._emit_children(node)
+        buf.append(f"</{tag}>\n")
 
     # Helper methods
 
-    def _render_attrs(self, attrs: dict[str, Any]) -> str:
+    def _render_attrs(self, attrs: dict[str, Any] | None) -> str:
         """Render HTML attributes.
 
         Args:
-            attrs: Dictionary of attributes
+            attrs: Dictionary of attributes, or None if the node has none
 
         Returns:
             HTML attribute string (including leading space if non-empty)
@@ -329,6 +507,20 @@ class HTMLRenderer(Renderer):
         if not attrs:
             return ""
 
+        # Memoize the common single string attribute, e.g. a code block's
+        # language class. Other values are not cached since True == 1 as a
+        # dict key but they render differently
+        if len(attrs) == 1:
+            ((key, value),) = attrs.items()
+            if type(value) is str:
+                cache = self._attr_cache
+                cached = cache.get((key, value))
+                if cached is None:
+                    if len(cache) >= _ATTR_CACHE_SIZE:
+                        cache.clear()
+                    cached = cache[key, value] = f' {key}="{self.escape(value)}"'
+                return cached
+
         parts = []
         for key, value in attrs.items():
             if value is True:
@@ -343,6 +535,29 @@ class HTMLRenderer(Renderer):
             return " " + " ".join(parts)
         return ""
 
+    def _render_attrs_except(self, attrs: dict[str, Any], skip: frozenset[str]) -> str:
+        """Render HTML attributes other than those already written.
+
+        Args:
+            attrs: Dictionary of attributes
+            skip: Keys to leave out
+
+        Returns:
+            HTML attribute string (including leading space if non-empty)
+        """
+        parts = []
+        for key, value in attrs.items():
+            if key in skip or value is False or value is None:
+                continue
+            if value is True:
+                parts.append(key)
+            else:
+                parts.append(f'{key}="{self.escape(str(value))}"')
+
+        if parts:
+            return " " + " ".join(parts)
+        return ""
+
     def _apply_typographer(self, text: str) -> str:
         """Apply smart typography transformations.
 
@@ -352,12 +567,10 @@ class HTMLRenderer(Renderer):
         Returns:
             Text with smart quotes and other typography
         """
-        # Basic smart quotes
-        if len(self.quotes) >= 4:
-            # For now, skip smart quote replacement due to encoding issues
-            pass
+        # Smart quotes (self.quotes) are skipped for now due to encoding issues
 
-        # Other typography
+        # Chained str.replace beats a single re.sub with a replacement
+        # callback, and returns the input itself when nothing matches
         text = text.replace("--", "—")  # Em dash
         return text.replace("...", "…")  # Ellipsis
 
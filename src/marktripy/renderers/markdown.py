@@ -3,6 +3,8 @@
 
 from __future__ import annotations
 
+import re
+from collections.abc import Callable
 from typing import Any
 
 from loguru import logger
@@ -29,9 +31,65 @@ from marktripy.core.ast import (
 )
 from marktripy.renderers.base import RenderContext, Renderer, RendererRegistry
 
+# Characters backslash-escaped in text; the backslash itself must come first
+_ESCAPED_CHARS = ("\\", "*", "_", "`", "[", "]", "(", ")", "#", "+", "-", "!", "|", "{", "}")
+
+
+# Runs of the character that delimits inline code
+_BACKTICK_RUN = re.compile("`+")
+
+
+def _longest_run(run: re.Pattern[str], text: str) -> int:
+    """Get the length of the longest match of a character run pattern.
+
+    Args:
+        run: Pattern matching runs of one character
+        text: Text to search
+
+    Returns:
+        Length of the longest run, or 0 if there is none
+    """
+    return max(map(len, run.findall(text)), default=0)
+
+
+def _prefix_lines(text: str, prefix: str, blank: str) -> str:
+    """Prefix every line of a text, writing empty lines as ``blank`` instead.
+
+    Works on the whole string with ``str.replace`` rather than splitting it
+    into lines and joining them again.
+
+    Args:
+        text: Text to prefix
+        prefix: Prefix for non-empty lines
+        blank: Replacement for empty lines
+
+    Returns:
+        The prefixed text
+    """
+    newline_prefix = "\n" + prefix
+    prefixed = prefix + text.replace("\n", newline_prefix)
+    if "\n\n" in text:
+        # Adjacent empty lines share a newline, so one replace() pass only
+        # catches every other one
+        empty = newline_prefix + "\n"
+        fixed = "\n" + blank + "\n"
+        prefixed = prefixed.replace(empty, fixed).replace(empty, fixed)
+    if not text or text[0] == "\n":
+        prefixed = blank + prefixed[len(prefix) :]
+    if text.endswith("\n"):
+        prefixed = prefixed[: -len(prefix)] + blank
+    return prefixed
+
 
 class MarkdownRenderer(Renderer):
-    """Renderer that converts AST back to Markdown."""
+    """Renderer that converts AST back to Markdown.
+
+    Like HTMLRenderer, output is written to a single list of string parts
+    that is joined once at the end. A ``render_<type>`` method either
+    appends to ``self._buf`` and returns None, or returns its Markdown as a
+    string, which is then appended for it. Blocks whose content needs
+    rewriting (block quotes, lists, tables) render it to a string first.
+    """
 
     def __init__(self, config: dict[str, Any] | None = None):
         """Initialize Markdown renderer.
@@ -54,9 +112,26 @@ class MarkdownRenderer(Renderer):
         self.strong_char = self.config.get("strong_char", "**")
         self.bullet_char = self.config.get("bullet_char", "-")
         self.code_fence = self.config.get("code_fence", "`")
+        self._fence_run = re.compile(re.escape(self.code_fence) + "+")
         self.line_width = self.config.get("line_width", 0)
 
         self.context = RenderContext()
+        self._buf: list[str] = []
+
+        # List item renderers keyed by whether the item is a task; extensions
+        # such as TaskListExtension replace the True entry
+        self._list_item_renderers: dict[bool, Callable[[ListItem], str]] = {
+            False: self._render_plain_list_item,
+            True: self._render_plain_list_item,
+        }
+
+        # Child nodes are written with _emit_child. A subclass that overrides
+        # render_node() gets every node passed to it, as the public hook
+        self._emit_child: Callable[[ASTNode], None] = (
+            self._emit
+            if type(self).render_node is MarkdownRenderer.render_node
+            else self._emit_via_render_node
+        )
         logger.info("Initialized MarkdownRenderer")
 
     def render(self, ast: Document) -> str:
@@ -69,7 +144,9 @@ class MarkdownRenderer(Renderer):
             The rendered Markdown
         """
         self.context = RenderContext()
-        return self.render_node(ast).rstrip() + "\n"
+        self._buf = []
+        self._emit_child(ast)
+        return "".join(self._buf).rstrip() + "\n"
 
     def render_node(self, node: ASTNode) -> str:
         """Render a single AST node.
@@ -80,9 +157,12 @@ class MarkdownRenderer(Renderer):
         Returns:
             The rendered Markdown
         """
-        method_name = f"render_{node.type}"
-        render_method = getattr(self, method_name, self.render_unknown)
-        return render_method(node)
+        buf = self._buf
+        mark = len(buf)
+        self._emit(node)
+        rendered = "".join(buf[mark:])
+        del buf[mark:]
+        return rendered
 
     def render_unknown(self, node: ASTNode) -> str:
         """Render unknown node types.
@@ -93,7 +173,7 @@ class MarkdownRenderer(Renderer):
         Returns:
             Empty string with warning
         """
-        logger.warning(f"Unknown node type: {node.type}")
+        logger.warning("Unknown node type: {}", node.type)
         return ""
 
     def render_children(self, node: ASTNode, separator: str = "") -> str:
@@ -106,46 +186,125 @@ class MarkdownRenderer(Renderer):
         Returns:
             Concatenated rendered children
         """
-        parts = []
+        buf = self._buf
+        mark = len(buf)
+        self._emit_children(node, separator)
+        rendered = "".join(buf[mark:])
+        del buf[mark:]
+        return rendered
+
+    def _emit(self, node: ASTNode) -> None:
+        """Write the Markdown for a node to the output buffer.
+
+        Args:
+            node: The node to render
+        """
+        # Only the lookup is guarded: a KeyError raised while rendering
+        # must not be taken for an unknown node type
+        try:
+            render_method = self._dispatch[node.type]
+        except KeyError:
+            # Covers methods added to the class after this instance was made
+            render_method = getattr(self, f"render_{node.type}", self.render_unknown)
+        rendered = render_method(node)
+        if rendered:
+            self._buf.append(rendered)
+
+    def _emit_via_render_node(self, node: ASTNode) -> None:
+        """Write the Markdown for a node returned by an overridden ``render_node``.
+
+        Args:
+            node: The node to render
+        """
+        rendered = self.render_node(node)
+        if rendered:
+            self._buf.append(rendered)
+
+    def _emit_children(self, node: ASTNode, separator: str = "") -> None:
+        """Write the Markdown for all children of a node to the output buffer.
+
+        Args:
+            node: Parent node
+            separator: String written between children with non-empty output
+        """
+        buf = self._buf
+        emit = self._emit_child
+        if not separator:
+            for child in node.children:
+                emit(child)
+            return
+
+        first = True
         for child in node.children:
-            rendered = self.render_node(child)
-            if rendered:
-                parts.append(rendered)
-        return separator.join(parts)
+            start = len(buf)
+            if not first:
+                buf.append(separator)
+            content_start = len(buf)
+            emit(child)
+            if any(buf[content_start:]):
+                first = False
+            else:
+                del buf[start:]
+
+    def _rstrip_buffer(self, mark: int) -> bool:
+        """Strip trailing whitespace from the output written since ``mark``.
+
+        Args:
+            mark: Buffer index where the output to strip starts
+
+        Returns:
+            Whether any non-whitespace output remains
+        """
+        buf = self._buf
+        while len(buf) > mark:
+            part = buf[-1].rstrip()
+            if part:
+                buf[-1] = part
+                return True
+            buf.pop()
+        return False
 
     # Document and structure nodes
 
-    def render_document(self, node: Document) -> str:
+    def render_document(self, node: Document) -> None:
         """Render document node."""
         # Render children with double newline between blocks
-        parts = []
+        buf = self._buf
+        emit = self._emit_child
+        first = True
         for child in node.children:
-            rendered = self.render_node(child).rstrip()
-            if rendered:
-                parts.append(rendered)
-        return "\n\n".join(parts) + "\n"
+            start = len(buf)
+            if not first:
+                buf.append("\n\n")
+            content_start = len(buf)
+            emit(child)
+            if self._rstrip_buffer(content_start):
+                first = False
+            else:
+                del buf[start:]
+        buf.append("\n")
 
-    def render_heading(self, node: Heading) -> str:
+    def render_heading(self, node: Heading) -> str | None:
         """Render heading node."""
-        content = self.render_children(node)
-
         # Use setext style for h1/h2 if configured
         if self.heading_style == "setext" and node.level <= 2:
+            content = self.render_children(node)
             underline = "=" if node.level == 1 else "-"
             return f"{content}\n{underline * len(content)}"
 
         # Default to ATX style
-        return f"{'#' * node.level} {content}"
+        self._buf.append(f"{'#' * node.level} ")
+        self._emit_children(node)
+        return None
 
-    def render_paragraph(self, node: Paragraph) -> str:
+    def render_paragraph(self, node: Paragraph) -> str | None:
         """Render paragraph node."""
-        content = self.render_children(node)
-
         # Wrap if configured
         if self.line_width > 0:
-            content = self._wrap_text(content, self.line_width)
+            return self._wrap_text(self.render_children(node), self.line_width)
 
-        return content
+        self._emit_children(node)
+        return None
 
     def render_blockquote(self, node: BlockQuote) -> str:
         """Render blockquote node."""
@@ -153,10 +312,7 @@ class MarkdownRenderer(Renderer):
         content = self.render_children(node, "\n\n")
 
         # Add > prefix to each line
-        lines = content.split("\n")
-        quoted_lines = [f"> {line}" if line else ">" for line in lines]
-
-        return "\n".join(quoted_lines)
+        return _prefix_lines(content, "> ", ">")
 
     def render_horizontal_rule(self, node: HorizontalRule) -> str:
         """Render horizontal rule node."""
@@ -167,27 +323,30 @@ class MarkdownRenderer(Renderer):
     def render_text(self, node: Text) -> str:
         """Render text node."""
         # Escape special Markdown characters
+        # Don't escape period unless it's at the start of a line after a number
         text = node.content or ""
 
-        # Escape backslashes first
-        text = text.replace("\\", "\\\\")
-
-        # Escape other special characters that need escaping
-        # Don't escape period unless it's at the start of a line after a number
-        for char in ["*", "_", "`", "[", "]", "(", ")", "#", "+", "-", "!", "|", "{", "}"]:
-            text = text.replace(char, f"\\{char}")
+        # Most text has none of these, so test before replacing: a
+        # replace() call costs more than a failed membership test
+        for char in _ESCAPED_CHARS:
+            if char in text:
+                text = text.replace(char, "\\" + char)
 
         return text
 
-    def render_emphasis(self, node: Emphasis) -> str:
+    def render_emphasis(self, node: Emphasis) -> None:
         """Render emphasis (italic) node."""
-        content = self.render_children(node)
-        return f"{self.emphasis_char}{content}{self.emphasis_char}"
+        buf = self._buf
+        buf.append(self.emphasis_char)
+        self._emit_children(node)
+        buf.append(self.emphasis_char)
 
-    def render_strong(self, node: Strong) -> str:
+    def render_strong(self, node: Strong) -> None:
         """Render strong (bold) node."""
-        content = self.render_children(node)
-        return f"{self.strong_char}{content}{self.strong_char}"
+        buf = self._buf
+        buf.append(self.strong_char)
+        self._emit_children(node)
+        buf.append(self.strong_char)
 
     # Code nodes
 
@@ -199,9 +358,10 @@ class MarkdownRenderer(Renderer):
         # Use fence style
         fence = self.code_fence * 3
 
-        # Ensure content doesn't contain fence
+        # Ensure content doesn't contain fence: make it longer than any run
+        # of the fence character in the content
         if fence in content:
-            fence = self.code_fence * 4
+            fence = self.code_fence * (_longest_run(self._fence_run, content) + 1)
 
         # Remove trailing newline from content if present
         if content.endswith("\n"):
@@ -213,10 +373,12 @@ class MarkdownRenderer(Renderer):
         """Render inline code node."""
         content = node.content or ""
 
-        # Determine number of backticks needed
-        backticks = "`"
-        while backticks in content:
-            backticks += "`"
+        if "`" not in content:
+            return f"`{content}`"
+
+        # Use one more backtick than the longest run in the content
+        longest = _longest_run(_BACKTICK_RUN, content) if "``" in content else 1
+        backticks = "`" * (longest + 1)
 
         # Add spaces if content starts/ends with backtick
         if content.startswith("`") or content.endswith("`"):
@@ -226,21 +388,23 @@ class MarkdownRenderer(Renderer):
 
     # Link and image nodes
 
-    def render_link(self, node: Link) -> str:
+    def render_link(self, node: Link) -> None:
         """Render link node."""
-        text = self.render_children(node)
+        buf = self._buf
+        buf.append("[")
+        self._emit_children(node)
         href = node.href or ""
         title = node.title
 
         # Check for reference-style link
         ref_id = node.get_attr("reference_id")
         if ref_id:
-            return f"[{text}][{ref_id}]"
-
+            buf.append(f"][{ref_id}]")
         # Inline link
-        if title:
-            return f'[{text}]({href} "{title}")'
-        return f"[{text}]({href})"
+        elif title:
+            buf.append(f']({href} "{title}")')
+        else:
+            buf.append(f"]({href})")
 
     def render_image(self, node: Image) -> str:
         """Render image node."""
@@ -259,28 +423,23 @@ class MarkdownRenderer(Renderer):
         self.context.enter_list(node.tight)
 
         parts = []
+        ordered = node.ordered
+        start = node.start or 1
         for i, child in enumerate(node.children):
             if isinstance(child, ListItem):
                 # Determine marker
-                if node.ordered:
-                    start = node.start or 1
-                    marker = f"{start + i}."
-                else:
-                    marker = self.bullet_char
+                marker = f"{start + i}." if ordered else self.bullet_char
 
                 # Render item
                 item_content = self.render_list_item(child)
 
-                # Format with proper indentation
-                lines = item_content.split("\n")
-                if lines:
-                    parts.append(f"{marker} {lines[0]}")
+                # Format with proper indentation; most items are one line
+                if "\n" in item_content:
+                    first, _, rest = item_content.partition("\n")
                     # Indent continuation lines
-                    for line in lines[1:]:
-                        if line:
-                            parts.append(f"   {line}")
-                        else:
-                            parts.append("")
+                    parts.append(f"{marker} {first}\n{_prefix_lines(rest, '   ', '')}")
+                else:
+                    parts.append(f"{marker} {item_content}")
 
         self.context.exit_list()
 
@@ -288,16 +447,15 @@ class MarkdownRenderer(Renderer):
 
     def render_list_item(self, node: ListItem) -> str:
         """Render list item node."""
-        # In tight lists, don't add extra newlines
-        separator = "\n" if self.context.tight_list else "\n\n"
-
-        content = self.render_children(node, separator)
+        return self._list_item_renderers[bool(node.get_attr("task"))](node)
 
-        # Strip extra newlines for tight lists
+    def _render_plain_list_item(self, node: ListItem) -> str:
+        """Render a list item without extension handling."""
+        # In tight lists, don't add extra newlines
         if self.context.tight_list:
-            content = content.strip()
-
-        return content
+            # Strip extra newlines for tight lists
+            return self.render_children(node, "\n").strip()
+        return self.render_children(node, "\n\n")
 
     # Table nodes
 
@@ -326,31 +484,45 @@ class MarkdownRenderer(Renderer):
         all_rows = [header_row] if header_row else []
         all_rows.extend(rows)
 
-        col_widths = self._calculate_column_widths(all_rows)
+        # Cell contents rendered while measuring, keyed by id(cell), so each
+        # cell is rendered once rather than again for output
+        cell_text: dict[int, str] = {}
+        col_widths = self._calculate_column_widths(all_rows, cell_text)
 
         # Render table
         parts = []
 
         # Header
         if header_row:
-            parts.append(self._render_table_row(header_row, col_widths))
+            parts.append(self._render_table_row(header_row, col_widths, cell_text))
             parts.append(self._render_separator_row(header_row, col_widths))
 
         # Body
         for row in rows:
-            parts.append(self._render_table_row(row, col_widths))
+            parts.append(self._render_table_row(row, col_widths, cell_text))
 
         self.context.exit_table()
 
         return "\n".join(parts)
 
-    def _render_table_row(self, row: TableRow, col_widths: list[int]) -> str:
-        """Render a table row with proper spacing."""
+    def _render_table_row(
+        self, row: TableRow, col_widths: list[int], cell_text: dict[int, str]
+    ) -> str:
+        """Render a table row with proper spacing.
+
+        Args:
+            row: Row to render
+            col_widths: Width of each column
+            cell_text: Rendered cell contents from _calculate_column_widths
+
+        Returns:
+            The row as a single line of Markdown
+        """
         cells = []
 
         for i, child in enumerate(row.children):
             if isinstance(child, TableCell):
-                content = self.render_children(child).strip()
+                content = cell_text[id(child)]
                 width = col_widths[i] if i < len(col_widths) else 0
 
                 # Pad content
@@ -385,8 +557,18 @@ class MarkdownRenderer(Renderer):
 
         return f"| {' | '.join(separators)} |"
 
-    def _calculate_column_widths(self, rows: list[TableRow]) -> list[int]:
-        """Calculate minimum column widths for table."""
+    def _calculate_column_widths(
+        self, rows: list[TableRow], cell_text: dict[int, str]
+    ) -> list[int]:
+        """Calculate minimum column widths for table.
+
+        Args:
+            rows: Rows of the table, header first
+            cell_text: Filled with each cell's rendered content, keyed by id(cell)
+
+        Returns:
+            The width of each column
+        """
         if not rows:
             return []
 
@@ -398,7 +580,7 @@ class MarkdownRenderer(Renderer):
         for row in rows:
             for i, child in enumerate(row.children):
                 if isinstance(child, TableCell) and i < num_cols:
-                    content = self.render_children(child).strip()
+                    content = cell_text[id(child)] = self.render_children(child).strip()
                     widths[i] = max(widths[i], len(content))
 
         return widths
@@ -418,28 +600,27 @@ class MarkdownRenderer(Renderer):
         if not text or width <= 0:
             return text
 
-        # Simple word wrapping (could be improved)
-        words = text.split()
-        lines = []
-        current_line = []
-        current_length = 0
+        # Simple word wrapping (could be improved): words and the spaces or
+        # newlines between them go into one list that is joined once
+        words = iter(text.split())
+        first = next(words, None)
+        if first is None:
+            return ""
 
+        parts = [first]
+        line_length = len(first)
         for word in words:
             word_length = len(word)
 
-            if current_length + word_length + len(current_line) <= width:
-                current_line.append(word)
-                current_length += word_length
+            if line_length + 1 + word_length <= width:
+                parts.append(" ")
+                line_length += 1 + word_length
             else:
-                if current_line:
-                    lines.append(" ".join(current_line))
-                current_line = [word]
-                current_length = word_length
-
-        if current_line:
-            lines.append(" ".join(current_line))
+                parts.append("\n")
+                line_length = word_length
+            parts.append(word)
 
-        return "\n".join(lines)
+        return "".join(parts)
 
 
 # Register the renderer
@@ -4,11 +4,17 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterator
 from typing import Any
 
 from loguru import logger
 
 from marktripy.core.ast import ASTNode, Document
+from marktripy.core.walker import ASTWalker, NodeVisitor
+
+# Node types with a visit_<type> method, per transformer class; dir() is too
+# slow to run for every transformer instance
+_VISITED_TYPES: dict[type, tuple[str, ...]] = {}
 
 
 class Transformer(ABC):
@@ -25,7 +31,20 @@ class Transformer(ABC):
             config: Transformer-specific configuration options
         """
         self.config = config or {}
-        logger.debug(f"Initialized {self.__class__.__name__} with config: {self.config}")
+
+        # Visit method per node type, built once so visit() needs no string
+        # formatting or attribute lookup per node. Types without a method are
+        # added as None on first sight, meaning generic_visit
+        cls = type(self)
+        node_types = _VISITED_TYPES.get(cls)
+        if node_types is None:
+            node_types = _VISITED_TYPES[cls] = tuple(
+                name[6:] for name in dir(cls) if name.startswith("visit_")
+            )
+        self._visitors: dict[str, Callable[[Any], ASTNode | None] | None] = {
+            node_type: getattr(self, "visit_" + node_type) for node_type in node_types
+        }
+        logger.debug("Initialized {} with config: {}", self.__class__.__name__, self.config)
 
     def transform(self, ast: Document) -> Document:
         """Transform an entire AST.
@@ -39,11 +58,11 @@ class Transformer(ABC):
         Returns:
             The transformed AST (may be the same object or a new one)
         """
-        logger.info(f"Starting transformation with {self.__class__.__name__}")
+        logger.info("Starting transformation with {}", self.__class__.__name__)
         result = self.visit(ast)
         if result is None:
             result = ast
-        logger.info(f"Completed transformation with {self.__class__.__name__}")
+        logger.info("Completed transformation with {}", self.__class__.__name__)
         return result
 
     def visit(self, node: ASTNode) -> ASTNode | None:
@@ -58,8 +77,12 @@ class Transformer(ABC):
         Returns:
             The transformed node, or None to remove the node
         """
-        method_name = f"visit_{node.type}"
-        visitor = getattr(self, method_name, self.generic_visit)
+        try:
+            visitor = self._visitors[node.type]
+        except KeyError:
+            visitor = self._visitors[node.type] = getattr(self, f"visit_{node.type}", None)
+        if visitor is None:
+            return self.generic_visit(node)
         return visitor(node)
 
     def generic_visit(self, node: ASTNode) -> ASTNode:
@@ -73,16 +96,79 @@ class Transformer(ABC):
         Returns:
             The node (potentially with transformed children)
         """
-        # Transform children
-        new_children = []
-        for child in node.children:
-            result = self.visit(child)
-            if result is not None:
-                new_children.append(result)
+        cls = type(self)
+        if cls.visit is not Transformer.visit or cls.generic_visit is not Transformer.generic_visit:
+            # Overrides must see every call, so recurse through them
+            new_children = []
+            for child in node.children:
+                result = self.visit(child)
+                if result is not None:
+                    new_children.append(result)
+            node.children = new_children
+            return node
+
+        # Descendants without a visit_<type> method are walked with an
+        # explicit stack rather than a recursive call each, so deep trees
+        # cannot hit the recursion limit. Each frame holds a node, an
+        # iterator over its original children and its new children list
+        visitors = self._visitors
+        stack: list[tuple[ASTNode, Iterator[ASTNode], list[ASTNode]]] = [
+            (node, iter(node.children), [])
+        ]
+        while stack:
+            current, pending, new_children = stack[-1]
+            for child in pending:
+                try:
+                    visitor = visitors[child.type]
+                except KeyError:
+                    visitor = visitors[child.type] = getattr(self, f"visit_{child.type}", None)
+                if visitor is None:
+                    stack.append((child, iter(child.children), []))
+                    break
+                result = visitor(child)
+                if result is not None:
+                    new_children.append(result)
+            else:
+                stack.pop()
+                current.children = new_children
+                if stack:
+                    stack[-1][2].append(current)
 
-        node.children = new_children
         return node
 
+    def get_node_visitor(self) -> dict[str, NodeVisitor] | None:
+        """Get per-node handlers that implement ``transform``.
+
+        Override this when the transformation only edits one node at a time
+        in place, with no setup or follow-up pass over the whole tree. A
+        TransformerChain then runs it in a traversal shared with adjacent
+        transformers instead of a separate walk.
+
+        Returns:
+            Mapping of node type to handler, or None to always use
+            ``transform``
+        """
+        return None
+
+    def _overrides_traversal(self, owner: type[Transformer], *names: str) -> bool:
+        """Check whether a subclass changed how ``transform`` reaches nodes.
+
+        A node visitor stands in for ``transform`` and the ``visit_*``
+        methods, so it must not be used once a subclass overrides them.
+
+        Args:
+            owner: Class that provides the node visitor
+            *names: Methods of ``owner`` that the node visitor replaces
+
+        Returns:
+            True if ``visit``, ``generic_visit`` or one of ``names`` is
+            overridden
+        """
+        cls = type(self)
+        if cls.visit is not Transformer.visit or cls.generic_visit is not Transformer.generic_visit:
+            return True
+        return any(getattr(cls, name) is not getattr(owner, name) for name in names)
+
     @abstractmethod
     def get_description(self) -> str:
         """Get a human-readable description of what this transformer does.
@@ -95,18 +181,26 @@ class Transformer(ABC):
 class TransformerChain:
     """Chain multiple transformers together."""
 
-    def __init__(self, transformers: list[Transformer]):
+    def __init__(self, transformers: list[Transformer], fused: bool = False):
         """Initialize transformer chain.
 
         Args:
             transformers: List of transformers to apply in order
+            fused: Run consecutive transformers that provide a node visitor
+                in a single traversal. Their handlers then run per node in
+                document order rather than one full pass after another
         """
         self.transformers = transformers
-        logger.debug(f"Created transformer chain with {len(transformers)} transformers")
+        self.fused = fused
+        logger.debug("Created transformer chain with {} transformers", len(transformers))
 
     def transform(self, ast: Document) -> Document:
         """Apply all transformers in sequence.
 
+        With ``fused`` set, consecutive transformers that provide a node
+        visitor are run together in a single traversal; the others run their
+        own ``transform`` in between, so the chain order is preserved.
+
         Args:
             ast: The AST to transform
 
@@ -114,8 +208,25 @@ class TransformerChain:
             The transformed AST
         """
         result = ast
+        if not self.fused:
+            for transformer in self.transformers:
+                result = transformer.transform(result)
+            return result
+
+        walker: ASTWalker | None = None
         for transformer in self.transformers:
+            visitor = transformer.get_node_visitor()
+            if visitor is not None:
+                if walker is None:
+                    walker = ASTWalker()
+                walker.register(visitor)
+                continue
+            if walker is not None:
+                walker.walk(result)
+                walker = None
             result = transformer.transform(result)
+        if walker is not None:
+            walker.walk(result)
         return result
 
     def add_transformer(self, transformer: Transformer) -> None:
@@ -125,7 +236,7 @@ class TransformerChain:
             transformer: Transformer to add
         """
         self.transformers.append(transformer)
-        logger.debug(f"Added {transformer.__class__.__name__} to chain")
+        logger.debug("Added {} to chain", transformer.__class__.__name__)
 
     def remove_transformer(self, transformer: Transformer) -> None:
         """Remove a transformer from the chain.
@@ -134,7 +245,7 @@ class TransformerChain:
             transformer: Transformer to remove
         """
         self.transformers.remove(transformer)
-        logger.debug(f"Removed {transformer.__class__.__name__} from chain")
+        logger.debug("Removed {} from chain", transformer.__class__.__name__)
 
 
 class TransformerRegistry:
@@ -154,7 +265,7 @@ class TransformerRegistry:
             raise TypeError(f"{transformer_class} must be a subclass of Transformer")
 
         cls._transformers[name] = transformer_class
-        logger.info(f"Registered transformer: {name} -> {transformer_class.__name__}")
+        logger.info("Registered transformer: {} -> {}", name, transformer_class.__name__)
 
     @classmethod
     def get(cls, name: str) -> type[Transformer]:
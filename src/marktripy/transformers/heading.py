@@ -7,7 +7,8 @@ from typing import Any
 
 from loguru import logger
 
-from marktripy.core.ast import ASTNode, Document, Heading
+from marktripy.core.ast import _DEBUG, TYPE_HEADING, ASTNode, Document, Heading
+from marktripy.core.walker import NodeVisitor
 from marktripy.transformers.base import Transformer
 
 
@@ -39,6 +40,10 @@ class HeadingLevelTransformer(Transformer):
 
         # Track original levels for normalization
         self.original_levels: list[int] = []
+        # Normalized level per original level, built on the first heading
+        # visited; _root is the document being transformed
+        self._level_map: dict[int, int] | None = None
+        self._root: ASTNode | None = None
 
     def get_description(self) -> str:
         """Get transformer description.
@@ -65,14 +70,18 @@ class HeadingLevelTransformer(Transformer):
         Returns:
             Transformed AST
         """
-        # For normalization, first collect all heading levels
+        # For normalization, heading levels are collected when the first
+        # heading is visited, so documents without headings skip that walk
         if self.operation == "normalize":
             self.original_levels = []
-            self._collect_heading_levels(ast)
-            logger.debug(f"Found heading levels: {sorted(set(self.original_levels))}")
+            self._level_map = None
+            self._root = ast
 
         # Apply transformation
-        return super().transform(ast)
+        try:
+            return super().transform(ast)
+        finally:
+            self._root = None
 
     def visit_heading(self, node: Heading) -> Heading:
         """Transform a heading node.
@@ -83,16 +92,43 @@ class HeadingLevelTransformer(Transformer):
         Returns:
             Transformed heading
         """
-        new_level = self._calculate_new_level(node.level)
-
-        if new_level != node.level:
-            logger.debug(f"Changing heading level from {node.level} to {new_level}")
-            node.level = new_level
+        self._set_heading_level(node)
 
         # Visit children
         self.generic_visit(node)
         return node
 
+    def get_node_visitor(self) -> dict[str, NodeVisitor] | None:
+        """Get the per-node handler for shared traversals.
+
+        Normalization needs every level in the document before the first
+        heading can be changed, so it keeps its own pass, as do subclasses
+        that override how headings are visited.
+
+        Returns:
+            Mapping of the heading type to the level update, or None
+        """
+        if self.operation == "normalize" or self._overrides_traversal(
+            HeadingLevelTransformer, "transform", "visit_heading"
+        ):
+            return None
+        return {TYPE_HEADING: self._set_heading_level}
+
+    def _set_heading_level(self, node: ASTNode) -> None:
+        """Apply the operation to a single heading's level.
+
+        Args:
+            node: The heading to update
+        """
+        if not isinstance(node, Heading):
+            return
+        new_level = self._calculate_new_level(node.level)
+
+        if new_level != node.level:
+            if _DEBUG:
+                logger.debug(f"Changing heading level from {node.level} to {new_level}")
+            node.level = new_level
+
     def _calculate_new_level(self, current_level: int) -> int:
         """Calculate new heading level based on operation.
 
@@ -111,7 +147,7 @@ class HeadingLevelTransformer(Transformer):
         elif self.operation == "normalize":
             new_level = self._normalize_level(current_level)
         else:
-            logger.warning(f"Unknown operation: {self.operation}")
+            logger.warning("Unknown operation: {}", self.operation)
             new_level = current_level
 
         # Clamp to valid range
@@ -126,14 +162,15 @@ class HeadingLevelTransformer(Transformer):
         Returns:
             Normalized level
         """
-        if not self.original_levels:
-            return current_level
+        level_map = self._level_map
+        if level_map is None:
+            if self._root is not None:
+                self._collect_heading_levels(self._root)
+                logger.debug("Found heading levels: {}", sorted(set(self.original_levels)))
 
-        # Find unique levels and sort them
-        unique_levels = sorted(set(self.original_levels))
-
-        # Map original levels to normalized levels (1, 2, 3, ...)
-        level_map = {old: new + 1 for new, old in enumerate(unique_levels)}
+            # Map original levels to normalized levels (1, 2, 3, ...)
+            unique_levels = sorted(set(self.original_levels))
+            level_map = self._level_map = {old: new + 1 for new, old in enumerate(unique_levels)}
 
         return level_map.get(current_level, current_level)
 
@@ -143,11 +180,14 @@ class HeadingLevelTransformer(Transformer):
         Args:
             node: Node to search for headings
         """
-        if isinstance(node, Heading):
-            self.original_levels.append(node.level)
-
-        for child in node.children:
-            self._collect_heading_levels(child)
+        levels = self.original_levels
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            if isinstance(current, Heading):
+                levels.append(current.level)
+            # Order is irrelevant: only the set of levels is used
+            stack.extend(current.children)
 
 
 class HeadingShifter(HeadingLevelTransformer):
@@ -7,7 +7,7 @@ from typing import Any
 
 from loguru import logger
 
-from marktripy.core.ast import ASTNode, Document, Heading
+from marktripy.core.ast import _DEBUG, ASTNode, Document
 from marktripy.transformers.base import Transformer
 from marktripy.utils.slugify import IDGenerator, extract_text
 
@@ -35,6 +35,8 @@ class IDGeneratorTransformer(Transformer):
         self.separator = self.config.get("separator", "-")
         self.overwrite = self.config.get("overwrite", False)
         self.target_elements = self.config.get("target_elements", ["heading"])
+        # Set form for the per-node membership test in visit()
+        self._target_types = frozenset(self.target_elements)
 
         # Initialize ID generator
         self.id_generator = IDGenerator(prefix=self.prefix, separator=self.separator)
@@ -77,28 +79,12 @@ class IDGeneratorTransformer(Transformer):
             The node (with ID added if applicable)
         """
         # Check if this node type should get an ID
-        if node.type in self.target_elements:
+        if node.type in self._target_types:
             self._add_id_to_node(node)
 
         # Continue with default visiting
         return super().visit(node)
 
-    def visit_heading(self, node: Heading) -> Heading:
-        """Visit a heading node.
-
-        Args:
-            node: The heading to process
-
-        Returns:
-            The heading with ID added
-        """
-        if "heading" in self.target_elements:
-            self._add_id_to_node(node)
-
-        # Visit children
-        self.generic_visit(node)
-        return node
-
     def _add_id_to_node(self, node: ASTNode) -> None:
         """Add an ID to a node if needed.
 
@@ -108,19 +94,21 @@ class IDGeneratorTransformer(Transformer):
         # Check if node already has an ID
         existing_id = node.get_attr("id")
         if existing_id and not self.overwrite:
-            logger.debug(f"Keeping existing ID: {existing_id}")
+            if _DEBUG:
+                logger.debug(f"Keeping existing ID: {existing_id}")
             return
 
         # Extract text content for ID generation
         text = extract_text(node)
         if not text:
-            logger.warning(f"No text content for ID generation in {node.type}")
+            logger.warning("No text content for ID generation in {}", node.type)
             return
 
         # Generate and set ID
         new_id = self.id_generator.generate(text)
         node.set_attr("id", new_id)
-        logger.debug(f"Generated ID '{new_id}' for {node.type}")
+        if _DEBUG:
+            logger.debug(f"Generated ID '{new_id}' for {node.type}")
 
     def _collect_existing_ids(self, node: ASTNode) -> None:
         """Collect existing IDs in the AST.
@@ -128,15 +116,22 @@ class IDGeneratorTransformer(Transformer):
         Args:
             node: Node to search for IDs
         """
-        # Check this node for an ID
-        existing_id = node.get_attr("id")
-        if existing_id:
-            self.id_generator.used_ids.add(existing_id)
-            logger.debug(f"Found existing ID: {existing_id}")
-
-        # Check children
-        for child in node.children:
-            self._collect_existing_ids(child)
+        existing = []
+        stack = [node]
+        while stack:
+            current = stack.pop()
+
+            # Check this node for an ID
+            attrs = current.attrs
+            if attrs:
+                existing_id = attrs.get("id")
+                if existing_id:
+                    existing.append(existing_id)
+
+            stack.extend(current.children)
+
+        self.id_generator.used_ids.update(existing)
+        logger.debug("Found {} existing IDs", len(existing))
 
 
 class HeadingIDGenerator(IDGeneratorTransformer):
@@ -7,7 +7,8 @@ from typing import Any
 
 from loguru import logger
 
-from marktripy.core.ast import Document, Link, Paragraph, Text
+from marktripy.core.ast import _DEBUG, TYPE_LINK, ASTNode, Document, Link, Paragraph, Text
+from marktripy.core.walker import NodeVisitor
 from marktripy.transformers.base import Transformer
 
 
@@ -102,7 +103,8 @@ class LinkReferenceTransformer(Transformer):
         self.links.append((ref_id, node.href, title))
 
         # Transform the link
-        logger.debug(f"Converting link '{link_text}' to reference [{ref_id}]")
+        if _DEBUG:
+            logger.debug(f"Converting link '{link_text}' to reference [{ref_id}]")
 
         # Create reference-style link
         # For now, we'll store the reference ID in a custom attribute
@@ -185,7 +187,7 @@ class LinkReferenceTransformer(Transformer):
             para.add_child(Text(content=ref_text))
             ast.add_child(para)
 
-        logger.info(f"Added {len(seen_refs)} references to document")
+        logger.info("Added {} references to document", len(seen_refs))
 
 
 class LinkCollector(Transformer):
@@ -213,10 +215,31 @@ class LinkCollector(Transformer):
         Returns:
             The unchanged link
         """
-        self.links.append(node)
+        self._collect_link(node)
         self.generic_visit(node)
         return node
 
+    def get_node_visitor(self) -> dict[str, NodeVisitor] | None:
+        """Get the per-node handler for shared traversals.
+
+        Subclasses that override how links are visited keep their own pass.
+
+        Returns:
+            Mapping of the link type to collecting the link, or None
+        """
+        if self._overrides_traversal(LinkCollector, "transform", "visit_link"):
+            return None
+        return {TYPE_LINK: self._collect_link}
+
+    def _collect_link(self, node: ASTNode) -> None:
+        """Collect a single link node.
+
+        Args:
+            node: The link to collect
+        """
+        if isinstance(node, Link):
+            self.links.append(node)
+
     def get_links(self) -> list[Link]:
         """Get collected links.
 
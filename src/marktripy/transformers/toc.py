@@ -7,7 +7,17 @@ from typing import Any
 
 from loguru import logger
 
-from marktripy.core.ast import ASTNode, Document, Heading, Link, List, ListItem, Paragraph, Text
+from marktripy.core.ast import (
+    _DEBUG,
+    ASTNode,
+    Document,
+    Heading,
+    Link,
+    List,
+    ListItem,
+    Paragraph,
+    Text,
+)
 from marktripy.transformers.base import Transformer
 from marktripy.utils.slugify import extract_text
 
@@ -30,6 +40,8 @@ class TOCGenerator(Transformer):
                 - insert: Whether to insert TOC in document (default: True)
                 - ordered: Whether to use ordered list (default: False)
                 - indent_size: Spaces per indent level (default: 2)
+                - clone: Insert into a deep copy instead of modifying the
+                  input document in place (default: False)
         """
         super().__init__(config)
 
@@ -40,9 +52,12 @@ class TOCGenerator(Transformer):
         self.insert = self.config.get("insert", True)
         self.ordered = self.config.get("ordered", False)
         self.indent_size = self.config.get("indent_size", 2)
+        self.clone = self.config.get("clone", False)
 
-        # Collected headings
-        self.headings: list[tuple[int, str, str | None]] = []  # (level, text, id)
+        # Collected headings, stored as parallel level/text/id columns
+        self._levels: list[int] = []
+        self._texts: list[str] = []
+        self._ids: list[str | None] = []
         self.toc_node: ASTNode | None = None
 
     def get_description(self) -> str:
@@ -65,14 +80,16 @@ class TOCGenerator(Transformer):
             Document with TOC inserted (if configured)
         """
         # Reset state
-        self.headings = []
+        self._levels = []
+        self._texts = []
+        self._ids = []
         self.toc_node = None
 
         # Collect headings
         self._collect_headings(ast)
 
         # Generate TOC
-        if self.headings:
+        if self._levels:
             self.toc_node = self._generate_toc()
 
         # Insert TOC if requested
@@ -86,21 +103,34 @@ class TOCGenerator(Transformer):
         """
         return self.toc_node
 
+    @property
+    def headings(self) -> list[tuple[int, str, str | None]]:
+        """Headings collected by the last transform, as (level, text, id) tuples."""
+        return list(zip(self._levels, self._texts, self._ids, strict=True))
+
     def _collect_headings(self, node: ASTNode) -> None:
         """Collect all headings in the specified level range.
 
         Args:
             node: Node to search for headings
         """
-        if isinstance(node, Heading) and self.min_level <= node.level <= self.max_level:
-            text = extract_text(node)
-            heading_id = node.get_attr("id")
-            self.headings.append((node.level, text, heading_id))
-            logger.debug(f"Found heading: L{node.level} '{text}' (id: {heading_id})")
-
-        # Recurse into children
-        for child in node.children:
-            self._collect_headings(child)
+        levels = self._levels
+        texts = self._texts
+        ids = self._ids
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            if isinstance(current, Heading) and self.min_level <= current.level <= self.max_level:
+                text = extract_text(current)
+                heading_id = current.get_attr("id")
+                levels.append(current.level)
+                texts.append(text)
+                ids.append(heading_id)
+                if _DEBUG:
+                    logger.debug(f"Found heading: L{current.level} '{text}' (id: {heading_id})")
+
+            # Reversed so children are visited in document order
+            stack.extend(reversed(current.children))
 
     def _generate_toc(self) -> ASTNode:
         """Generate the TOC structure.
@@ -120,34 +150,32 @@ class TOCGenerator(Transformer):
             toc_container.add_child(title_heading)
 
         # Create nested list structure
-        root_list = self._create_toc_list(self.headings)
+        root_list = self._create_toc_list()
         if root_list:
             toc_container.add_child(root_list)
 
-        logger.info(f"Generated TOC with {len(self.headings)} entries")
+        logger.info("Generated TOC with {} entries", len(self._levels))
         return toc_container
 
-    def _create_toc_list(self, headings: list[tuple[int, str, str | None]]) -> List | None:
-        """Create nested list structure for TOC.
-
-        Args:
-            headings: List of (level, text, id) tuples
+    def _create_toc_list(self) -> List | None:
+        """Create nested list structure for TOC from the collected headings.
 
         Returns:
             Root list node, or None if no headings
         """
-        if not headings:
+        if not self._levels:
             return None
 
-        # Normalize levels to start from 0
-        min_level = min(h[0] for h in headings)
-        normalized = [(level - min_level, text, heading_id) for level, text, heading_id in headings]
+        # Levels are normalized to start from 0 while building
+        min_level = min(self._levels)
 
         # Build tree structure
         root = List(ordered=self.ordered)
         stack: list[tuple[List, int]] = [(root, -1)]
 
-        for level, text, heading_id in normalized:
+        for raw_level, text, heading_id in zip(self._levels, self._texts, self._ids, strict=True):
+            level = raw_level - min_level
+
             # Pop stack until we find parent level
             while stack and stack[-1][1] >= level:
                 stack.pop()
@@ -184,8 +212,8 @@ class TOCGenerator(Transformer):
         Returns:
             Document with TOC inserted
         """
-        # Clone the AST to avoid modifying the original
-        result = ast.clone()
+        # Only copy the document when the caller needs the original intact
+        result = ast.clone() if self.clone else ast
 
         # Find marker or insert at beginning
         marker_found = self._replace_marker(result)
@@ -193,9 +221,8 @@ class TOCGenerator(Transformer):
         if not marker_found:
             # Insert at beginning after any front matter
             insert_pos = self._find_insert_position(result)
-            for i, child in enumerate(self.toc_node.children):
-                result.children.insert(insert_pos + i, child)
-            logger.info(f"Inserted TOC at position {insert_pos}")
+            result.children[insert_pos:insert_pos] = self.toc_node.children
+            logger.info("Inserted TOC at position {}", insert_pos)
 
         return result
 
@@ -208,37 +235,38 @@ class TOCGenerator(Transformer):
         Returns:
             True if marker was found and replaced
         """
-        # Check if this is a paragraph with just the marker
-        if isinstance(node, Paragraph) and len(node.children) == 1:
-            child = node.children[0]
-            if isinstance(child, Text) and child.content and child.content.strip() == self.marker:
-                # Replace this paragraph with TOC
-                parent = self._find_parent(node.walk()[0], node)
-                if parent:
-                    index = parent.children.index(node)
-                    parent.children.pop(index)
-                    for i, toc_child in enumerate(self.toc_node.children):
-                        parent.children.insert(index + i, toc_child)
-                    logger.info(f"Replaced marker '{self.marker}' with TOC")
+        # Pre-order walk over (parent, index, node) triples, so the marker's
+        # position is known without searching the tree again
+        marker = self.marker
+        stack: list[tuple[ASTNode | None, int, ASTNode]] = [(None, 0, node)]
+        while stack:
+            parent, index, current = stack.pop()
+
+            # Check if this is a paragraph with just the marker
+            if parent is not None and isinstance(current, Paragraph) and len(current.children) == 1:
+                child = current.children[0]
+                content = child.content
+                # The substring test rejects ordinary paragraphs without
+                # allocating a stripped copy of their text
+                if (
+                    isinstance(child, Text)
+                    and content
+                    and marker in content
+                    and content.strip() == marker
+                ):
+                    # Replace this paragraph with TOC
+                    parent.children[index : index + 1] = self.toc_node.children
+                    logger.info("Replaced marker '{}' with TOC", marker)
                     return True
 
-        # Recurse into children
-        return any(self._replace_marker(child) for child in node.children)
+            # Paragraphs and headings only hold inline content, so no marker
+            # paragraph can sit below them
+            children = current.children
+            if not children or isinstance(current, (Paragraph, Heading)):
+                continue
+            stack.extend((current, i, children[i]) for i in range(len(children) - 1, -1, -1))
 
-    def _find_parent(self, root: ASTNode, target: ASTNode) -> ASTNode | None:
-        """Find parent of a node.
-
-        Args:
-            root: Root node to search from
-            target: Node to find parent of
-
-        Returns:
-            Parent node, or None if not found
-        """
-        for node in root.walk():
-            if target in node.children:
-                return node
-        return None
+        return False
 
     def _find_insert_position(self, doc: Document) -> int:
         """Find appropriate position to insert TOC.
@@ -251,10 +279,15 @@ class TOCGenerator(Transformer):
         """
         # Skip any front matter or title heading
         for i, child in enumerate(doc.children):
-            # Skip metadata or front matter paragraphs
-            if isinstance(child, Paragraph):
-                text = extract_text(child).strip()
-                if text.startswith("---") or text.startswith("+++"):
+            # Skip metadata or front matter paragraphs; the fence is always at
+            # the start of the first text node, so the rest is not extracted
+            if isinstance(child, Paragraph) and child.children:
+                first = child.children[0]
+                if (
+                    isinstance(first, Text)
+                    and first.content
+                    and first.content.lstrip()[:3] in ("---", "+++")
+                ):
                     continue
 
             # Skip first heading if it's level 1 (likely title)
@@ -269,18 +302,21 @@ class TOCGenerator(Transformer):
 
 
 # Convenience functions
-def generate_toc(ast: Document, max_level: int = 3, insert: bool = True) -> Document:
+def generate_toc(
+    ast: Document, max_level: int = 3, insert: bool = True, clone: bool = False
+) -> Document:
     """Generate table of contents for the document.
 
     Args:
         ast: The document to process
         max_level: Maximum heading level to include
         insert: Whether to insert TOC in document
+        clone: Insert into a copy and leave the input document unchanged
 
     Returns:
         Document with TOC (if insert=True), otherwise original document
     """
-    generator = TOCGenerator({"max_level": max_level, "insert": insert})
+    generator = TOCGenerator({"max_level": max_level, "insert": insert, "clone": clone})
     return generator.transform(ast)
 
 
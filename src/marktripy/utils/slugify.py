@@ -9,6 +9,8 @@ from typing import Any
 
 from loguru import logger
 
+from marktripy.core.ast import _DEBUG
+
 
 def slugify(
     text: str,
@@ -61,7 +63,8 @@ def slugify(
     if max_length and len(text) > max_length:
         text = text[:max_length].rstrip(separator)
 
-    logger.debug(f"Slugified text: '{text}'")
+    if _DEBUG:
+        logger.debug(f"Slugified text: '{text}'")
     return text
 
 
@@ -95,7 +98,8 @@ def generate_id(text: str, existing_ids: set[str] | None = None) -> str:
         counter += 1
 
     unique_id = f"{base_id}-{counter}"
-    logger.debug(f"Generated unique ID: {unique_id}")
+    if _DEBUG:
+        logger.debug(f"Generated unique ID: {unique_id}")
     return unique_id
 
 
@@ -139,7 +143,7 @@ class IDGenerator:
         self.prefix = prefix
         self.separator = separator
         self.used_ids: set[str] = set()
-        logger.debug(f"Initialized IDGenerator with prefix='{prefix}'")
+        logger.debug("Initialized IDGenerator with prefix='{}'", prefix)
 
     def generate(self, text: str) -> str:
         """Generate a unique ID from text.
@@ -1,13 +1,39 @@
 # this_file: tests/test_basic.py
 """Basic tests for marktripy functionality."""
 
+import pickle
+
 import pytest
 
-from marktripy.core.ast import Document, Heading, Paragraph, Text
-from marktripy.core.parser import ParserRegistry
+from marktripy.core.ast import (
+    TYPE_LIST_ITEM,
+    TYPE_TABLE_ROW,
+    BlockQuote,
+    CodeBlock,
+    Document,
+    Emphasis,
+    Heading,
+    Link,
+    Paragraph,
+    Table,
+    TableCell,
+    TableRow,
+    Text,
+    make_text,
+)
+from marktripy.core.parser import (
+    ParserError,
+    ParserRegistry,
+    create_parser,
+    get_parser,
+    list_parsers,
+)
+from marktripy.core.validator import ASTValidator, ValidationError, validate_ast
+from marktripy.core.walker import ASTWalker
 from marktripy.parsers.markdown_it import MarkdownItParser
 from marktripy.renderers.base import RendererRegistry
 from marktripy.renderers.html import HTMLRenderer
+from marktripy.renderers.markdown import MarkdownRenderer
 
 
 class TestBasicFunctionality:
@@ -23,6 +49,13 @@ class TestBasicFunctionality:
         parser = ParserRegistry.create("markdown-it")
         assert isinstance(parser, MarkdownItParser)
 
+        # The module-level functions share the same registry
+        assert get_parser("markdown-it") is MarkdownItParser
+        assert isinstance(create_parser("markdown-it"), MarkdownItParser)
+        assert "markdown-it" in list_parsers()
+        with pytest.raises(KeyError, match="not registered"):
+            create_parser("missing")
+
     def test_renderer_registration(self):
         """Test that renderer can be registered and retrieved."""
         # Renderer should be auto-registered on import
@@ -153,6 +186,186 @@ def hello():
         assert "<ol>" in html
         assert "<li>First item</li>" in html
 
+    def test_render_node_and_children(self):
+        """Test rendering a subtree returns its HTML without leaking into later renders."""
+        parser = MarkdownItParser()
+        renderer = HTMLRenderer()
+        doc = parser.parse("# Title\n\nSome **bold** text.\n\n \n")
+
+        para = doc.children[1]
+        assert renderer.render_node(para) == "<p>Some <strong>bold</strong> text.</p>\n"
+        assert renderer.render_children(para) == "Some <strong>bold</strong> text."
+        assert renderer.render(doc) == "<h1>Title</h1>\n<p>Some <strong>bold</strong> text.</p>\n"
+        assert renderer.render_node(doc.children[0]) == "<h1>Title</h1>\n"
+
+    def test_markdown_render_node_and_children(self):
+        """Test Markdown subtree rendering and separators between non-empty children."""
+        renderer = MarkdownRenderer()
+        doc = MarkdownItParser().parse("# Title\n\nSome **bold** [link](u).\n\n> a\n>\n> b\n")
+        doc.children.insert(1, Paragraph())
+
+        expected = "# Title\n\nSome **bold** [link](u).\n\n> a\n>\n> b\n"
+        assert renderer.render(doc) == expected
+        assert renderer.render_node(doc.children[2]) == "Some **bold** [link](u)."
+        assert renderer.render_children(doc, "|") == "# Title|Some **bold** [link](u).|> a\n>\n> b"
+        assert renderer.render(doc) == expected
+
+    def test_render_dispatch_override(self):
+        """Test that render methods set on an instance after init are dispatched."""
+        renderer = HTMLRenderer()
+        doc = MarkdownItParser().parse("Some *text*.")
+
+        renderer.render_emphasis = lambda node: "<i>" + renderer.render_children(node) + "</i>"
+
+        assert renderer.render(doc) == "<p>Some <i>text</i>.</p>\n"
+
+        md = MarkdownRenderer()
+        md.render_emphasis = lambda node: "_" + md.render_children(node) + "_"
+
+        assert md.render(doc) == "Some _text_.\n"
+
+    def test_render_node_override(self):
+        """Test that an overridden render_node sees every node."""
+
+        class TaggingHTMLRenderer(HTMLRenderer):
+            def render_node(self, node):
+                rendered = super().render_node(node)
+                return "[text]" + rendered if node.type == "text" else rendered
+
+        class TaggingMarkdownRenderer(MarkdownRenderer):
+            def render_node(self, node):
+                rendered = super().render_node(node)
+                return "[text]" + rendered if node.type == "text" else rendered
+
+        doc = MarkdownItParser().parse("hi *there*")
+
+        assert TaggingHTMLRenderer().render(doc) == "<p>[text]hi <em>[text]there</em></p>\n"
+        assert TaggingMarkdownRenderer().render(doc) == "[text]hi *[text]there*\n"
+
+    def test_render_attrs(self):
+        """Test attribute rendering, including memoized single attributes."""
+        renderer = HTMLRenderer()
+
+        assert renderer._render_attrs(None) == ""
+        assert renderer._render_attrs({"class": "a<b"}) == ' class="a&lt;b"'
+        assert renderer._render_attrs({"class": "a<b"}) == ' class="a&lt;b"'
+        assert renderer._render_attrs({"open": True}) == " open"
+        assert renderer._render_attrs({"open": 1}) == ' open="1"'
+        assert renderer._render_attrs({"id": "x", "hidden": False}) == ' id="x"'
+
+    def test_link_and_image_attrs_escaped_once(self):
+        """Test that link and image attributes are escaped exactly once."""
+        doc = MarkdownItParser().parse('[a](http://x?a=1&b=2 "t<") ![i&](y.png)')
+        html = HTMLRenderer().render(doc)
+
+        assert '<a href="http://x?a=1&amp;b=2" title="t&lt;">a</a>' in html
+        assert '<img src="y.png" alt="i&amp;">' in html
+
+    def test_link_and_image_extra_attrs(self):
+        """Test that parsed links and images render their fields before other attrs."""
+        doc = MarkdownItParser().parse('[a](u "t") ![i](y.png)')
+        link, image = doc.children[0].children[0], doc.children[0].children[2]
+        link.set_attr("id", "x")
+        link.set_attr("title", "stale")
+        image.set_attr("loading", "lazy")
+        image.set_attr("hidden", True)
+        html = HTMLRenderer().render(doc)
+
+        assert '<a href="u" title="t" id="x">a</a>' in html
+        assert '<img src="y.png" alt="i" loading="lazy" hidden>' in html
+
+    def test_capabilities_follow_enable_disable(self):
+        """Test that cached capabilities are refreshed when rules change."""
+        parser = MarkdownItParser(config={"cache_size": 2})
+        assert parser.get_capabilities()["tables"] is False
+
+        parser.parse("| a |\n|---|\n| 1 |\n")
+        parser.enable("table")
+        assert parser.get_capabilities()["tables"] is True
+        assert parser.parse("| a |\n|---|\n| 1 |\n").children[0].type == "table"
+
+        parser.disable("table")
+        assert parser.get_capabilities()["tables"] is False
+
+    def test_adjacent_text_merged(self):
+        """Test that adjacent inline text, breaks and HTML become one Text node."""
+        doc = MarkdownItParser().parse("line one\nline *two\nthree* <b>x</b> end\n")
+
+        para = doc.children[0]
+        assert [child.type for child in para.children] == ["text", "emphasis", "text"]
+        assert para.children[0].content == "line one\nline "
+        assert para.children[1].children[0].content == "two\nthree"
+        assert para.children[2].content == " <b>x</b> end"
+
+    def test_table_followed_by_paragraph(self):
+        """Test that table sections keep all rows and later blocks are parsed."""
+        parser = MarkdownItParser(config={"preset": "default"})
+
+        doc = parser.parse("| a | b |\n|---|---|\n| 1 | 2 |\n| 3 | 4 |\n\nAfter.\n")
+
+        assert [child.type for child in doc.children] == ["table", "paragraph"]
+        assert len(doc.children[0].children) == 3
+        assert "<p>After.</p>" in HTMLRenderer().render(doc)
+
+    def test_parse_cache(self):
+        """Test that repeated parses are served from the opt-in cache."""
+        parser = MarkdownItParser(config={"cache_size": 2})
+        renderer = HTMLRenderer()
+        markdown = "# Title\n\nSome *text*."
+
+        first = parser.parse(markdown)
+        first.children[0].set_attr("id", "mutated")
+        second = parser.parse(markdown)
+
+        assert second is not first
+        assert second.children[0].get_attr("id") is None
+        assert renderer.render(second) == renderer.render(MarkdownItParser().parse(markdown))
+        assert parser.validate_markdown(markdown) == []
+        assert parser.cache_info() == {"hits": 1, "misses": 1, "size": 1, "maxsize": 2}
+
+        parser.parse("a")
+        parser.parse("b")
+        assert parser.cache_info()["size"] == 2
+        parser.invalidate_cache()
+        assert parser.cache_info()["size"] == 0
+
+    def test_parse_cache_skips_postprocess(self):
+        """Test that cached parses reuse the postprocessed AST."""
+        calls = []
+
+        class EnrichingParser(MarkdownItParser):
+            def postprocess(self, ast):
+                calls.append(ast)
+                ast.children[0].set_attr("id", "title")
+                return ast
+
+        parser = EnrichingParser(config={"cache_size": 4})
+        first = parser.parse("# Title\n")
+        second = parser.parse("# Title\n")
+
+        assert len(calls) == 1
+        assert second.children[0].get_attr("id") == "title"
+        assert second == first
+
+    def test_parse_and_validate(self):
+        """Test parsing and validating in a single call."""
+        parser = MarkdownItParser()
+
+        doc, errors = parser.parse_and_validate("# Title\n")
+
+        assert isinstance(doc, Document)
+        assert errors == []
+        assert parser.validate_markdown("# Title\n") == []
+
+    def test_preprocess_line_endings(self):
+        """Test that CRLF and lone CR line endings are normalized."""
+        parser = MarkdownItParser()
+
+        assert parser.preprocess("a\r\nb\rc") == "a\nb\nc\n"
+        assert parser.preprocess("a\r\nb\r\n") == "a\nb\n"
+        assert parser.preprocess("a\nb") == "a\nb\n"
+        assert parser.preprocess("") == ""
+
     def test_html_escaping(self):
         """Test that HTML special characters are escaped."""
         parser = MarkdownItParser()
@@ -193,6 +406,54 @@ class TestASTManipulation:
         assert len(text_nodes) == 3
         assert all(node.type == "text" for node in text_nodes)
 
+    def test_flatten(self):
+        """Test flattening the tree into a pre-order array."""
+        doc = Document()
+        h1 = Heading(level=1)
+        h1.add_child(Text("Title"))
+        doc.add_child(h1)
+        para = Paragraph()
+        para.add_child(Text("Some "))
+        para.add_child(Text("text"))
+        doc.add_child(para)
+
+        flat = doc.flatten()
+
+        assert [node for node, _ in flat] == doc.walk()
+        assert [size for _, size in flat] == [6, 2, 1, 3, 1, 1]
+
+    def test_make_text(self):
+        """Test the fast Text factory matches the constructor."""
+        fast = make_text("hello")
+
+        assert isinstance(fast, Text)
+        assert fast == Text("hello")
+        fast.set_attr("id", "x")
+        assert fast.get_attr("id") == "x"
+
+    def test_make_text_shared(self):
+        """Test that shared Text nodes are cached only for short content."""
+        assert make_text(" ", shared=True) is make_text(" ", shared=True)
+        assert make_text(" ") is not make_text(" ")
+        assert make_text("long", shared=True) is not make_text("long", shared=True)
+
+        markdown = "One, two\nthree ***four*** five."
+        plain = MarkdownItParser().parse(markdown)
+        shared = MarkdownItParser(config={"share_text": True}).parse(markdown)
+        assert HTMLRenderer().render(shared) == HTMLRenderer().render(plain)
+
+    def test_freeze(self):
+        """Test freezing children into tuples keeps rendering unchanged."""
+        parser = MarkdownItParser()
+        renderer = HTMLRenderer()
+        doc = parser.parse("# Title\n\n- one\n- **two**\n\n> quote\n")
+        expected = renderer.render(doc)
+
+        doc.freeze()
+
+        assert all(isinstance(node.children, tuple) for node in doc.walk())
+        assert renderer.render(doc) == expected
+
     def test_node_manipulation(self):
         """Test adding, removing, and replacing nodes."""
         para = Paragraph()
@@ -216,10 +477,18 @@ class TestASTManipulation:
         para.replace_child(text3, new_text)
         assert para.children == [text1, new_text]
 
+        # Test adding in bulk
+        para.add_children(Text(word) for word in ("a", "b"))
+        assert [child.content for child in para.children] == ["Hello", "Python", "a", "b"]
+
     def test_node_attributes(self):
         """Test node attribute management."""
         heading = Heading(level=2)
 
+        # Attribute storage is only allocated on first write
+        assert heading.attrs is None
+        assert heading.get_attr("id") is None
+
         # Test setting and getting attributes
         heading.set_attr("id", "my-heading")
         heading.set_attr("class", "special")
@@ -249,6 +518,140 @@ class TestASTManipulation:
         cloned.children[0].children[0].content = "Modified"
         assert para.children[0].content == "Original"  # Original unchanged
 
+    def test_nodes_are_slotted(self):
+        """Test that concrete nodes carry no per-instance __dict__."""
+        heading = Heading(level=3)
+        heading.add_child(Text("Title"))
+
+        assert not hasattr(heading, "__dict__")
+        assert not hasattr(heading.children[0], "__dict__")
+        assert heading.level == 3
+        with pytest.raises(AttributeError):
+            heading.undeclared = True
+
+    def test_validator_checks_nested_inline(self):
+        """Test that pruning leaves still validates links inside emphasis."""
+        para = Paragraph()
+        emphasis = Emphasis()
+        emphasis.add_child(Link(href=""))
+        para.add_children([Text("see "), emphasis])
+        doc = Document()
+        doc.add_child(para)
+
+        errors = validate_ast(doc)
+
+        assert [str(error) for error in errors] == ["Link has no href at link node"]
+
+    def test_validator_subclass_checks_leaves(self):
+        """Test that leaf checks added by a subclass run in both traversals."""
+
+        class LeafValidator(ASTValidator):
+            def _validate_text(self, node):
+                if not node.content.strip():
+                    self._add_error("Blank text", node)
+
+            def _validate_code_block(self, node):
+                if not node.language:
+                    self._add_error("Code block has no language", node)
+
+        para = Paragraph()
+        para.add_child(Text(" "))
+        doc = Document()
+        doc.add_children([para, CodeBlock("x = 1")])
+        expected = ["Blank text at text node", "Code block has no language at code_block node"]
+
+        validator = LeafValidator()
+        assert [str(error) for error in validator.validate(doc)] == expected
+
+        walker = ASTWalker()
+        validator.register_visitor(walker)
+        walker.walk(doc)
+        assert [str(error) for error in validator.errors] == expected
+
+    def test_validator_table_column_counts(self):
+        """Test that rows with differing cell counts are reported once."""
+        table = Table()
+        for cells in (2, 2, 3, 1):
+            row = TableRow()
+            row.add_children(TableCell() for _ in range(cells))
+            table.add_child(row)
+        doc = Document()
+        doc.add_child(table)
+
+        errors = validate_ast(doc)
+
+        assert [str(error) for error in errors] == [
+            "Table has inconsistent column counts at table node"
+        ]
+
+    def test_validate_strict_stops_at_first_error(self):
+        """Test that strict validation raises without collecting later errors."""
+        para = Paragraph()
+        para.add_children([Link(href=""), Link(href="")])
+        doc = Document()
+        doc.add_child(para)
+        validator = ASTValidator()
+
+        with pytest.raises(ValidationError, match="Link has no href"):
+            validator.validate_strict(doc)
+
+        assert len(validator.errors) == 1
+        assert len(validator.validate(doc)) == 2
+
+    def test_errors_pickle(self):
+        """Test that error classes keep their message and fields when pickled."""
+        node = Link(href="")
+        errors = [ValidationError("Link has no href", node), ParserError("Bad", line=2, column=5)]
+
+        for error in errors:
+            restored = pickle.loads(pickle.dumps(error))
+            assert str(restored) == str(error)
+
+        assert pickle.loads(pickle.dumps(errors[0])).node == node
+        restored = pickle.loads(pickle.dumps(errors[1]))
+        assert (restored.line, restored.column) == (2, 5)
+
+    def test_validator_on_error_callback(self):
+        """Test that errors can be streamed to a callback instead of collected."""
+        link = Link(href="")
+        para = Paragraph()
+        para.add_child(link)
+        doc = Document()
+        doc.add_child(para)
+        reported = []
+        validator = ASTValidator(on_error=lambda message, node: reported.append((message, node)))
+
+        assert validator.validate(doc) == []
+        assert reported == [("Link has no href", link)]
+
+        with pytest.raises(ValidationError):
+            validator.validate_strict(doc)
+
+    def test_validator_dispatch_keys_interned(self):
+        """Test that dispatch keys are the interned node type constants."""
+        keys = {key: key for key in ASTValidator()._dispatch}
+
+        assert keys[TYPE_LIST_ITEM] is TYPE_LIST_ITEM
+        assert keys[TYPE_TABLE_ROW] is TYPE_TABLE_ROW
+
+    def test_deep_tree_traversal(self):
+        """Test that traversal does not recurse on deeply nested trees."""
+        doc = Document()
+        node = doc
+        for _ in range(5000):
+            quote = BlockQuote()
+            node.add_child(quote)
+            node = quote
+        node.add_child(Text("leaf"))
+
+        assert len(doc.walk()) == 5002
+        assert len(doc.find_all("blockquote")) == 5000
+        assert doc.find_all("text")[0].content == "leaf"
+
+        cloned = doc.clone()
+        assert len(cloned.walk()) == 5002
+        assert cloned.find_all("text")[0] is not doc.find_all("text")[0]
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
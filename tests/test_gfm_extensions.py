@@ -12,6 +12,7 @@ from marktripy.extensions.tasklist import TaskListExtension
 from marktripy.extensions.gfm import GFMExtension
 from marktripy.extensions.base import ExtensionManager
 from marktripy.core.ast import ListItem
+from marktripy.core.validator import ASTValidator
 
 
 class TestStrikethroughExtension:
@@ -156,6 +157,50 @@ class TestTaskListExtension:
         task_items = [n for n in ast.walk() if isinstance(n, ListItem) and n.get_attr('task')]
         assert len(task_items) == 3
 
+    def test_overridden_transform_ast_is_called(self):
+        """Test that the manager runs a subclass's own transform_ast."""
+
+        class ClassedTaskList(TaskListExtension):
+            def transform_ast(self, ast):
+                ast = super().transform_ast(ast)
+                for node in ast.walk():
+                    if isinstance(node, ListItem) and node.get_attr("task"):
+                        node.set_attr("class", "task")
+                return ast
+
+        parser = ParserRegistry.create("markdown-it")
+        ext_manager = ExtensionManager()
+        ext_manager.register(ClassedTaskList())
+
+        ast = ext_manager.apply_ast_transformations(parser.parse("- [ ] todo\n- plain\n"))
+
+        classes = [n.get_attr("class") for n in ast.walk() if isinstance(n, ListItem)]
+        assert classes == ["task", None]
+
+    def test_multiline_task_item(self):
+        """Test that a task item's text may continue on the next line."""
+        parser = ParserRegistry.create("markdown-it")
+        ast = parser.parse("- [x] Done\n  and more\n")
+
+        TaskListExtension().transform_ast(ast)
+
+        item = next(n for n in ast.walk() if isinstance(n, ListItem))
+        assert item.get_attr("task") is True
+        assert item.get_attr("checked") is True
+        assert item.children[0].content == "Done\nand more"
+
+    def test_task_added_after_parse(self):
+        """Test that list items added after parsing are still converted."""
+        parser = ParserRegistry.create("markdown-it")
+        ast = parser.parse("Intro\n")
+        ast.children.extend(parser.parse("- [ ] todo\n").children)
+
+        TaskListExtension().transform_ast(ast)
+
+        item = next(n for n in ast.walk() if isinstance(n, ListItem))
+        assert item.get_attr("task") is True
+        assert item.get_attr("checked") is False
+
 
 class TestGFMBundle:
     """Test the complete GFM extension bundle."""
@@ -218,4 +263,35 @@ This has ~~strikethrough~~ text.
         
         assert "~~strikethrough~~" in result
         assert "[x] Completed" in result
-        assert "[ ] Pending" in result
\ No newline at end of file
+        assert "[ ] Pending" in result
+
+    def test_hook_lists_follow_registration(self):
+        """Test that only overriding extensions are kept per hook."""
+        ext_manager = ExtensionManager()
+        ext_manager.register(StrikethroughExtension())
+        ext_manager.register(TaskListExtension())
+
+        assert [ext.name for ext in ext_manager._ast_hooks] == ["strikethrough", "tasklist"]
+        assert ext_manager._block_hooks == []
+
+        ext_manager.unregister("strikethrough")
+        assert [ext.name for ext in ext_manager._ast_hooks] == ["tasklist"]
+
+    def test_fused_transform_and_validation(self):
+        """Test that validation can share the transformation traversal."""
+        parser = ParserRegistry.create("markdown-it", config={"preset": "default"})
+        text = "# Tasks\n\n- [x] Done ~~old~~\n- [ ] Todo\n- Plain\n"
+
+        ext_manager = ExtensionManager()
+        ext_manager.register(StrikethroughExtension())
+        ext_manager.register(TaskListExtension())
+        expected = ext_manager.apply_ast_transformations(parser.parse(text))
+
+        validator = ASTValidator(strict=True)
+        fused = ext_manager.apply_ast_transformations(parser.parse(text), validator=validator)
+
+        assert fused == expected
+        assert validator.errors == validator.validate(expected) == []
+        items = [n for n in fused.walk() if isinstance(n, ListItem)]
+        assert [item.get_attr("checked") for item in items] == [True, False, None]
+
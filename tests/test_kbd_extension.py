@@ -41,6 +41,7 @@ class TestKbdExtension:
         assert len(kbd_nodes) == 2
         assert kbd_nodes[0].key == "Ctrl"
         assert kbd_nodes[1].key == "Alt"
+        assert not hasattr(kbd_nodes[0], "__dict__")
 
     def test_kbd_html_rendering(self):
         """Test HTML rendering of keyboard keys."""
@@ -131,6 +132,21 @@ class TestKbdExtension:
         assert len(kbd_nodes) == 1
         assert kbd_nodes[0].key == "Delete"
 
+    def test_kbd_as_whole_text_node(self):
+        """Test kbd syntax that makes up an entire text node."""
+        parser = ParserRegistry.create("markdown-it")
+        ext_manager = ExtensionManager()
+        ext_manager.register(KbdExtension())
+        ext_manager.apply_parser_extensions(parser)
+
+        text = "Hold **++Ctrl++** first."
+        ast = parser.parse(text)
+        ast = ext_manager.apply_ast_transformations(ast)
+
+        kbd_nodes = [n for n in ast.walk() if isinstance(n, KeyboardKey)]
+        assert len(kbd_nodes) == 1
+        assert kbd_nodes[0].key == "Ctrl"
+
     def test_incomplete_kbd_syntax(self):
         """Test incomplete kbd syntax is not parsed."""
         parser = ParserRegistry.create("markdown-it")
@@ -126,6 +126,20 @@ def hello():
         
         assert result.strip() == original
 
+    def test_backtick_runs_in_code(self):
+        """Test that code containing backtick runs keeps its content."""
+        original = "Run ``` a``b ```\n\n`````\n````\nx\n`````\n"
+
+        parser = ParserRegistry.create("markdown-it")
+        renderer = MarkdownRenderer()
+
+        ast = parser.parse(original)
+        result = renderer.render(ast)
+        reparsed = parser.parse(result)
+
+        assert reparsed.children[0].children[1].content == "a``b"
+        assert reparsed.children[1].content == "````\nx\n"
+
     def test_links(self):
         """Test round-trip for links."""
         test_cases = [
@@ -280,6 +294,8 @@ class TestParserComparison:
             "- List item 1\n- List item 2",
             "[Link](https://example.com)",
             "> Blockquote text",
+            '![Logo](logo.png "Company Logo")',
+            "- Loose item 1\n\n- Loose item 2",
         ]
         
         for doc in test_docs:
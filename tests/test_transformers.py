@@ -3,19 +3,25 @@
 
 import pytest
 
-from marktripy.core.ast import Document, Heading, Link, List, ListItem, Paragraph, Text
+from marktripy.core.ast import BlockQuote, Document, Heading, Link, List, ListItem, Paragraph, Text
 from marktripy.core.parser import ParserRegistry
 from marktripy.core.validator import validate_ast
 from marktripy.parsers.markdown_it import MarkdownItParser  # Import to register
+from marktripy.transformers.base import TransformerChain
 from marktripy.transformers.heading import (
     HeadingNormalizer,
+    HeadingShifter,
     decrease_heading_levels,
     increase_heading_levels,
     normalize_headings,
 )
 from marktripy.transformers.id_generator import add_heading_ids, add_ids_to_elements
-from marktripy.transformers.link_reference import collect_links, convert_to_reference_links
-from marktripy.transformers.toc import extract_toc, generate_toc
+from marktripy.transformers.link_reference import (
+    LinkCollector,
+    collect_links,
+    convert_to_reference_links,
+)
+from marktripy.transformers.toc import TOCGenerator, extract_toc, generate_toc
 
 
 class TestHeadingTransformer:
@@ -162,6 +168,19 @@ class TestIDGenerator:
         assert headings[0].get_attr("id") == "custom-id"  # Preserved
         assert headings[1].get_attr("id") == "section"  # Generated
 
+    def test_overwrite_ids_once(self):
+        """Test that overwriting assigns each heading a single new ID."""
+        doc = Document()
+        for level in (1, 2):
+            h = Heading(level=level)
+            h.add_child(Text(content="Intro"))
+            h.set_attr("id", "old")
+            doc.add_child(h)
+
+        result = add_heading_ids(doc, overwrite=True)
+
+        assert [h.get_attr("id") for h in result.find_all("heading")] == ["intro", "intro-1"]
+
     def test_id_prefix(self):
         """Test ID generation with prefix."""
         doc = Document()
@@ -225,6 +244,20 @@ class TestLinkReference:
         assert links[0].href == "https://example.com"
         assert links[1].href == "https://github.com"
 
+    def test_collect_links_deeply_nested(self):
+        """Test that traversal does not recurse once per nesting level."""
+        doc = Document()
+        parent = doc
+        for _ in range(5000):
+            quote = BlockQuote()
+            parent.add_child(quote)
+            parent = quote
+        link = Link(href="https://example.com")
+        link.add_child(Text(content="deep"))
+        parent.add_child(link)
+
+        assert collect_links(doc) == [link]
+
     def test_convert_to_reference_links_numeric(self):
         """Test converting inline links to numeric references."""
         doc = Document()
@@ -351,6 +384,62 @@ class TestTOCGenerator:
         # Should have more nodes than original due to TOC
         assert len(result.find_all("list")) > 0
 
+    def test_toc_replaces_marker(self):
+        """Test that the TOC marker paragraph is replaced in place."""
+        parser = ParserRegistry.create("markdown-it")
+        ast = parser.parse("# Title\n\n> [[TOC]]\n\n## Section 1\n\n## Section 2\n")
+
+        result = generate_toc(add_heading_ids(ast), max_level=3, insert=True)
+
+        quote = result.children[1]
+        assert quote.type == "blockquote"
+        assert [child.type for child in quote.children] == ["heading", "list"]
+        assert not any(
+            node.content and "[[TOC]]" in node.content for node in result.find_all("text")
+        )
+
+    def test_toc_clone_option(self):
+        """Test that the TOC is inserted in place unless a copy is requested."""
+        parser = ParserRegistry.create("markdown-it")
+        ast = parser.parse("# Title\n\n## Section\n")
+
+        copied = generate_toc(ast, clone=True)
+        assert copied is not ast
+        assert not ast.find_all("list")
+
+        in_place = generate_toc(ast)
+        assert in_place is ast
+        assert ast.find_all("list")
+
+    def test_collected_headings(self):
+        """Test that collected headings are exposed as (level, text, id) tuples."""
+        doc = Document()
+        for level, title in ((1, "Intro"), (2, "Usage"), (4, "Deep")):
+            h = Heading(level=level)
+            h.add_child(Text(content=title))
+            doc.add_child(h)
+        doc.children[1].set_attr("id", "usage")
+
+        generator = TOCGenerator({"insert": False})
+        generator.transform(doc)
+
+        assert generator.headings == [(1, "Intro", None), (2, "Usage", "usage")]
+
+    def test_toc_skips_front_matter(self):
+        """Test that the TOC is inserted after front matter paragraphs."""
+        doc = Document()
+        front = Paragraph()
+        front.add_child(Text(content="+++ title = 'x' +++"))
+        h2 = Heading(level=2)
+        h2.add_child(Text(content="Section"))
+        doc.add_child(front)
+        doc.add_child(h2)
+
+        result = generate_toc(doc, insert=True)
+
+        assert result.children[0].children[0].content.startswith("+++")
+        assert [child.type for child in result.children[1:]] == ["heading", "list", "heading"]
+
     def test_toc_with_links(self):
         """Test that TOC entries link to headings."""
         doc = Document()
@@ -421,4 +510,50 @@ Final section.
 
         # TOC should be present
         lists = ast.find_all("list")
-        assert len(lists) > 0  # At least one list (the TOC)
\ No newline at end of file
+        assert len(lists) > 0  # At least one list (the TOC)
+
+    def test_chain_shares_traversal(self):
+        """Test that a chain gives the same result as separate transforms."""
+        text = "# A [x](u)\n\n## B\n\n#### C [y](v)\n"
+        parser = MarkdownItParser()
+
+        expected = parser.parse(text)
+        for transformer in (HeadingShifter(1), HeadingNormalizer(), HeadingShifter(-1)):
+            expected = transformer.transform(expected)
+        separate = LinkCollector()
+        separate.transform(expected)
+
+        collector = LinkCollector()
+        chain = TransformerChain(
+            [HeadingShifter(1), HeadingNormalizer(), HeadingShifter(-1), collector], fused=True
+        )
+        result = chain.transform(parser.parse(text))
+
+        assert result == expected
+        assert [h.level for h in result.find_all("heading")] == [1, 1, 2]
+        assert [link.href for link in collector.links] == ["u", "v"]
+        assert collector.links == separate.links
+
+    def test_fused_chain_keeps_overridden_visitors(self):
+        """Test that a fused chain still calls overridden visit methods."""
+
+        class IdShifter(HeadingShifter):
+            def visit_heading(self, node):
+                node.set_attr("id", "x")
+                return super().visit_heading(node)
+
+        class TitleCollector(LinkCollector):
+            def visit_link(self, node):
+                node.title = "t"
+                return super().visit_link(node)
+
+        parser = MarkdownItParser()
+        for fused in (False, True):
+            collector = TitleCollector()
+            chain = TransformerChain([IdShifter(1), collector], fused=fused)
+            result = chain.transform(parser.parse("# A [x](u)\n"))
+
+            heading = result.find_all("heading")[0]
+            assert heading.get_attr("id") == "x"
+            assert heading.level == 2
+            assert [link.title for link in collector.links] == ["t"]